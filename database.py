@@ -8,6 +8,11 @@ Classes:
     Database: Connection pool management and initialization
     CursorFromConnectionPool: Context manager for safe database operations
     DatabaseError: Custom exception for database-related errors
+    PreparingConnection: Connection that tracks its server-side prepared statements
+    TrackingCursor: Cursor that tracks whether it has written anything
+
+Functions:
+    optional_cursor: Reuse a caller's cursor or open a pooled one
 
 Usage:
     # Initialize connection pool
@@ -18,17 +23,68 @@ Usage:
         cursor.execute('SELECT * FROM games')
         results = cursor.fetchall()
         
+    # Hot queries can be prepared once per connection and executed by name
+    Database.register_prepared_statement('game_by_id', 'SELECT name FROM games WHERE id = $1')
+    with CursorFromConnectionPool() as cursor:
+        Database.execute_prepared(cursor, 'game_by_id', (game_id,))
+        
+    # Model methods taking cursor= can share one transaction
+    with CursorFromConnectionPool() as cursor:
+        card = Flashcard.find_by_game_user_title(game_id, user_id, title, cursor=cursor)
+        card.update(cursor=cursor)
+        
 Features:
     - Connection pooling for performance
-    - Automatic transaction management
+    - Automatic transaction management (read-only work is never committed)
     - Error handling and rollback
     - Context manager safety
     - Connection testing and validation
+    - Server-side prepared statements for hot queries
+    
+Deployment:
+    Each pooled connection is a PostgreSQL session of its own. When many app
+    instances share one server, put PgBouncer in front of PostgreSQL to
+    multiplex them onto fewer backends. Use PgBouncer's session pooling mode:
+    the SQL-level PREPARE/EXECUTE statements used by execute_prepared() are
+    bound to a server session and do not survive transaction pooling.
 """
 
+import itertools
+from contextlib import contextmanager
 import psycopg2
+import psycopg2.extensions
 from psycopg2 import pool
 
+# Source of unique names for server-side (named) cursors
+_cursor_names = (f"server_cursor_{number}" for number in itertools.count(1))
+
+# Leading keywords of statements that never modify data. A transaction that
+# only ran these is rolled back instead of committed.
+_READ_ONLY_KEYWORDS = frozenset({"SELECT", "SHOW", "PREPARE"})
+
+
+@contextmanager
+def optional_cursor(cursor=None):
+    """Yield the given cursor, or a new pooled one if none is given.
+    
+    Lets model methods take an optional ``cursor`` argument. Callers that
+    pass a cursor run the method inside their own transaction (committed
+    when their CursorFromConnectionPool block exits). Otherwise the method
+    runs in its own transaction as before.
+    
+    Args:
+        cursor (psycopg2.cursor, optional): Cursor of an open
+            CursorFromConnectionPool block
+            
+    Yields:
+        psycopg2.cursor: The cursor to execute statements on
+    """
+    if cursor is not None:
+        yield cursor
+    else:
+        with CursorFromConnectionPool() as new_cursor:
+            yield new_cursor
+
 
 class DatabaseError(Exception):
     """Custom exception for database connection errors.
@@ -42,6 +98,86 @@ class DatabaseError(Exception):
     pass
 
 
+class PreparingConnection(psycopg2.extensions.connection):
+    """psycopg2 connection that remembers which statements it has prepared.
+    
+    Server-side prepared statements live for the lifetime of a PostgreSQL
+    session, so each pooled connection only needs to PREPARE a statement
+    once. The names already prepared on this session are kept in
+    ``prepared_statements``.
+    
+    Attributes:
+        prepared_statements (set): Names of statements PREPAREd on this connection
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+
+
+def _is_read_only(query):
+    """Tell whether a statement is known not to modify data.
+    
+    Only the leading keyword is inspected. ``EXECUTE name`` is classified by
+    the SQL registered for that prepared statement. Anything unrecognized
+    (including ``WITH`` queries, which may contain data-modifying CTEs) is
+    treated as a write.
+    
+    Args:
+        query (str | bytes): The statement passed to cursor.execute()
+        
+    Returns:
+        bool: True if the statement is a plain read
+    """
+    if isinstance(query, bytes):
+        query = query[:256].decode(errors="ignore")
+    if not isinstance(query, str):
+        return False
+        
+    words = query.split(None, 2)
+    if not words:
+        return False
+        
+    keyword = words[0].upper()
+    if keyword == "EXECUTE" and len(words) > 1:
+        sql = Database._prepared_statements.get(words[1])
+        return sql is not None and _is_read_only(sql)
+    return keyword in _READ_ONLY_KEYWORDS
+
+
+class TrackingCursor(psycopg2.extensions.cursor):
+    """psycopg2 cursor that records whether it has executed a write.
+    
+    CursorFromConnectionPool uses the ``dirty`` flag to commit only
+    transactions that modified data; read-only ones are rolled back.
+    
+    Attributes:
+        dirty (bool): True once a statement other than a plain read ran.
+            Set it manually after a SELECT that calls a data-modifying
+            function.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty = False
+
+    def execute(self, query, vars=None):
+        if not self.dirty and not _is_read_only(query):
+            self.dirty = True
+        return super().execute(query, vars)
+
+    def executemany(self, query, vars_list):
+        if not self.dirty and not _is_read_only(query):
+            self.dirty = True
+        return super().executemany(query, vars_list)
+
+    def copy_from(self, *args, **kwargs):
+        self.dirty = True
+        return super().copy_from(*args, **kwargs)
+
+    def copy_expert(self, *args, **kwargs):
+        self.dirty = True
+        return super().copy_expert(*args, **kwargs)
+
+
 class Database:
     """Manages database connections using a connection pool.
     
@@ -57,27 +193,49 @@ class Database:
         - Thread-safe connection management
         
     Class Attributes:
-        _connection_pool: The psycopg2 connection pool instance
+        KEEPALIVE_PARAMS: Default libpq TCP keepalive connection parameters
+        _connection_pool: The psycopg2 ThreadedConnectionPool instance
         _connection_error: Last connection error message for debugging
+        _prepared_statements: Registered prepared statement SQL keyed by name
         
     Thread Safety:
-        The underlying psycopg2 connection pool is thread-safe, making
-        this class suitable for multithreaded applications.
+        The pool is a psycopg2 ThreadedConnectionPool, whose getconn/putconn
+        are guarded by a lock. The UI thread and the background BGG worker
+        threads can therefore check out connections concurrently.
     """
     _connection_pool = None
     _connection_error = None
+    _prepared_statements = {}
+
+    # libpq TCP keepalive settings applied to every pooled connection unless
+    # overridden by the caller. Idle connections are probed after 30 s, so a
+    # dead peer or a NAT/firewall timeout is noticed instead of leaving a
+    # silently broken connection in the pool.
+    KEEPALIVE_PARAMS = {
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 3,
+    }
 
     @classmethod
-    def initialize(cls, minconn=1, maxconn=10, **kwargs):
+    def initialize(cls, minconn=1, maxconn=10, validate=True, **kwargs):
         """Initialize the database connection pool.
         
-        Sets up a PostgreSQL connection pool with the specified parameters.
-        Tests the connection to ensure it's working before returning.
+        Sets up a thread-safe PostgreSQL connection pool with the specified
+        parameters. By default the pre-opened connections are tested before
+        returning; pass validate=False to skip that startup round-trip.
         
         Args:
             minconn (int, optional): Minimum number of connections to maintain. Defaults to 1.
             maxconn (int, optional): Maximum number of connections allowed. Defaults to 10.
-            **kwargs: Database connection parameters (database, user, password, host, port)
+            validate (bool, optional): Run ``SELECT 1`` on each pre-opened
+                connection. Defaults to True. Creating the pool already
+                connects, so bad credentials or an unreachable server are
+                reported either way.
+            **kwargs: Database connection parameters (database, user, password, host, port).
+                Any libpq parameter may be passed; KEEPALIVE_PARAMS fill in
+                the TCP keepalive settings that are not given explicitly.
             
         Returns:
             bool: True if connection pool was created successfully
@@ -95,23 +253,91 @@ class Database:
             )
         """
         try:
-            cls._connection_pool = psycopg2.pool.SimpleConnectionPool(
+            cls._connection_pool = psycopg2.pool.ThreadedConnectionPool(
                 minconn,
                 maxconn,
-                **kwargs
+                connection_factory=PreparingConnection,
+                **{**cls.KEEPALIVE_PARAMS, **kwargs}
             )
             cls._connection_error = None
             
-            # Test the connection with a simple query
-            with cls.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute("SELECT 1")
+            # Test every pre-opened connection so the first page loads find a warm pool
+            if validate:
+                cls._warm_up(minconn)
                     
             return True
         except (psycopg2.OperationalError, psycopg2.DatabaseError) as e:
             cls._connection_error = str(e)
             raise DatabaseError(f"Failed to connect to database: {str(e)}")
     
+    @classmethod
+    def _warm_up(cls, count):
+        """Check out, ping, and return the pool's idle connections.
+        
+        psycopg2 opens ``minconn`` connections when the pool is created. This
+        runs ``SELECT 1`` on each of them so broken connections surface at
+        startup instead of on the first user action, and the backends have
+        already served a query when real traffic arrives.
+        
+        Args:
+            count (int): Number of connections to warm (normally minconn)
+            
+        Raises:
+            psycopg2.OperationalError: If any connection fails the ping
+        """
+        connections = []
+        try:
+            for _ in range(count):
+                connections.append(cls.get_connection())
+            for conn in connections:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                conn.rollback()
+        finally:
+            for conn in connections:
+                cls.return_connection(conn)
+
+    @classmethod
+    def register_prepared_statement(cls, name, sql):
+        """Register a statement to be prepared server-side on first use.
+        
+        Registration is cheap and is normally done at module import time.
+        The statement is only PREPAREd on a connection the first time it is
+        executed there through execute_prepared().
+        
+        Args:
+            name (str): Statement name (a valid SQL identifier, unique per app)
+            sql (str): The statement text using PostgreSQL $1, $2... placeholders
+        """
+        cls._prepared_statements[name] = sql
+
+    @classmethod
+    def execute_prepared(cls, cursor, name, params=()):
+        """Execute a registered prepared statement on a cursor.
+        
+        Prepares the statement on the cursor's connection if this session has
+        not seen it yet. Every later call skips PostgreSQL's parse and plan
+        steps and only sends ``EXECUTE name (...)``.
+        
+        Args:
+            cursor (psycopg2.cursor): Cursor from CursorFromConnectionPool
+            name (str): Name given to register_prepared_statement()
+            params (tuple, optional): Values for the $n placeholders
+            
+        Note:
+            Results are fetched from the cursor as for a normal execute().
+        """
+        conn = cursor.connection
+        if name not in conn.prepared_statements:
+            cursor.execute(f"PREPARE {name} AS {cls._prepared_statements[name]}")
+            conn.prepared_statements.add(name)
+
+        if params:
+            placeholders = ", ".join(["%s"] * len(params))
+            cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+        else:
+            cursor.execute(f"EXECUTE {name}")
+
     @classmethod
     def get_connection_error(cls):
         """Get the last connection error message for debugging.
@@ -197,22 +423,44 @@ class CursorFromConnectionPool:
             cursor.execute('INSERT INTO games (name) VALUES (%s)', ('Catan',))
             # Automatic commit on success, rollback on exception
             
+        # Large result sets can be streamed from a server-side cursor
+        with CursorFromConnectionPool(server_side=True) as cursor:
+            cursor.execute('SELECT id, name FROM games')
+            for row in cursor:  # fetched itersize rows at a time
+                ...
+            
     Attributes:
         conn: The database connection (set during context entry)
         cursor: The database cursor (set during context entry)
+        server_side (bool): Whether a named (server-side) cursor is used
+        itersize (int): Rows fetched per network round-trip by a server-side cursor
         
     Thread Safety:
         Each instance manages its own connection and cursor, making it
         safe to use in multithreaded environments.
     """
-    def __init__(self):
+    def __init__(self, server_side=False, itersize=2000):
         """Initialize the context manager.
         
         Sets up initial state with no connection or cursor.
         Actual resource acquisition happens in __enter__.
+        
+        Args:
+            server_side (bool, optional): Use a named cursor so PostgreSQL keeps
+                the result set and rows are streamed in batches instead of
+                being loaded into memory at once. Defaults to False.
+            itersize (int, optional): Batch size used when iterating a
+                server-side cursor. Defaults to 2000.
+                
+        Note:
+            A server-side cursor runs a single SELECT (it is declared with
+            ``DECLARE ... CURSOR FOR``), so it cannot be used with
+            Database.execute_prepared() or for writes.
         """
         self.conn = None
         self.cursor = None
+        self.server_side = server_side
+        self.itersize = itersize
 
     def __enter__(self):
         """Enter the context manager and acquire database resources.
@@ -231,7 +479,11 @@ class CursorFromConnectionPool:
         """
         try:
             self.conn = Database.get_connection()
-            self.cursor = self.conn.cursor()
+            if self.server_side:
+                self.cursor = self.conn.cursor(name=next(_cursor_names), cursor_factory=TrackingCursor)
+                self.cursor.itersize = self.itersize
+            else:
+                self.cursor = self.conn.cursor(cursor_factory=TrackingCursor)
             return self.cursor
         except (psycopg2.OperationalError, psycopg2.DatabaseError) as e:
             Database._connection_error = str(e)
@@ -241,10 +493,13 @@ class CursorFromConnectionPool:
         """Exit the context manager and clean up resources.
         
         Handles transaction control based on whether an exception occurred:
-        - If exception: Rollback transaction
-        - If success: Commit transaction and close cursor
+        - If exception: Close the cursor, then rollback transaction
+        - If success: Close cursor, then commit if the cursor wrote anything
+          and roll back otherwise (a server-side cursor must be closed before
+          its transaction ends)
         
-        Always returns the connection to the pool for reuse.
+        The cursor is always closed and the connection is always returned
+        to the pool for reuse.
         
         Args:
             exception_type (type): Type of exception if one occurred
@@ -258,10 +513,22 @@ class CursorFromConnectionPool:
         if self.conn is None:
             return
             
-        if exception_value:
-            self.conn.rollback()
-        else:
-            if self.cursor:
+        try:
+            if exception_value:
+                # Close before the rollback (a named cursor is invalid once its
+                # transaction ends), and never let a failing close mask the
+                # caller's exception
+                try:
+                    self.cursor.close()
+                except psycopg2.Error:
+                    pass
+                self.conn.rollback()
+            else:
                 self.cursor.close()
-            self.conn.commit()
-        Database.return_connection(self.conn)
\ No newline at end of file
+                if self.cursor.dirty:
+                    self.conn.commit()
+                else:
+                    # Nothing to make durable; rollback just ends the transaction
+                    self.conn.rollback()
+        finally:
+            Database.return_connection(self.conn)
\ No newline at end of file
@@ -35,30 +35,136 @@ Environment Variables:
     DB_PASSWORD - Database password
     DB_HOST - Database host (default: localhost)
     DB_PORT - Database port (default: 5432)
+    DB_POOL_MIN - Connections opened and warmed up at startup (default: 5)
+    DB_POOL_MAX - Maximum pooled connections (default: 25)
+    BCRYPT_ROUNDS - bcrypt cost factor for password hashing (default: 12)
+    MEASURE_HASH_TIME - Set to 1 to log how long one password hash takes with
+        BCRYPT_ROUNDS, measured in the background after startup (default: off)
 """
 
+import asyncio
 import flet as ft
+import functools
+import logging
 import os
-from typing import Optional
+import re
+import threading
 from dotenv import load_dotenv
+
+# Load environment variables before importing modules that read them at import time
+load_dotenv()
+
 from database import Database, DatabaseError
-from models.user import User
+from models.user import User, BCRYPT_ROUNDS
+from utils.ttl_cache import TTLCache
 from pages.auth_page import AuthPage
-from pages.main_page import MainPage
-from pages.game_search_page import GameSearchPage
-from pages.game_detail_page import GameDetailPage
-from pages.create_flashcard_page import CreateFlashcardPage
+# The other pages are imported at login (see bind_page_factories): they pull
+# in the game model, requests and Pillow, none of which the login page needs
+
+# Parameterized routes, compiled once; the groups capture the IDs and category
+CREATE_FLASHCARD_ROUTE = re.compile(r"^/game/(\d+)/create_flashcard/([^/]+)$")
+EDIT_FLASHCARD_ROUTE = re.compile(r"^/game/(\d+)/flashcard/(\d+)/edit_flashcard$")
+GAME_DETAIL_ROUTE = re.compile(r"^/game/(\d+)$")
+
+logger = logging.getLogger(__name__)
+
+# Seconds a rendered list view (main page, game detail) is reused before it is rebuilt
+VIEW_CACHE_TTL = 30
+
+
+# Pool sizes used when DB_POOL_MIN / DB_POOL_MAX are unset or invalid
+DEFAULT_POOL_MIN = 5
+DEFAULT_POOL_MAX = 25
+
+
+def read_pool_size(name, default, minimum):
+    """Read a connection pool size from the environment.
+    
+    A malformed or too small value falls back to the default with a warning
+    instead of raising, so a typo in the configuration still lets the app
+    start (and show the database error view if connecting fails).
+    
+    Args:
+        name (str): Environment variable to read
+        default (int): Value used when the variable is unset or invalid
+        minimum (int): Smallest accepted value
+        
+    Returns:
+        int: The configured pool size
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        size = int(value)
+    except ValueError:
+        size = None
+    if size is None or size < minimum:
+        logger.warning("Ignoring %s=%r: expected an integer >= %d, using %d", name, value, minimum, default)
+        return default
+    return size
+
+
+@functools.lru_cache(maxsize=None)
+def database_settings():
+    """Read the database connection settings from the environment.
+    
+    The environment is read on the first call only; later calls (for example
+    reconnect attempts after a failed login) reuse the cached settings.
+    
+    Returns:
+        dict: Keyword arguments for Database.initialize()
+    """
+    minconn = read_pool_size("DB_POOL_MIN", DEFAULT_POOL_MIN, minimum=0)
+    maxconn = read_pool_size("DB_POOL_MAX", DEFAULT_POOL_MAX, minimum=1)
+    if minconn > maxconn:
+        # The pool cannot keep more idle connections than it may open
+        logger.warning("DB_POOL_MIN=%d exceeds DB_POOL_MAX=%d, raising the maximum to %d", minconn, maxconn, minconn)
+        maxconn = minconn
+        
+    return {
+        "database": os.getenv("DB_NAME", "bgg_flashcards"),
+        "user": os.getenv("DB_USER"),
+        "password": os.getenv("DB_PASSWORD"),
+        "host": os.getenv("DB_HOST", "localhost"),
+        "port": os.getenv("DB_PORT", "5432"),
+        "minconn": minconn,
+        "maxconn": maxconn,
+    }
 
-# Load environment variables
-load_dotenv()
 
+def log_hash_time():
+    """Log the cost of one password hash so BCRYPT_ROUNDS can be tuned."""
+    logger.info("Password hashing: %.0f ms per hash (BCRYPT_ROUNDS=%d)",
+                User.measure_hash_time(), BCRYPT_ROUNDS)
 
-def main(page: ft.Page):
+
+def pop_view(page):
+    """Pop the top view and navigate to the one underneath it.
+    
+    After a write the view stack is dropped and rebuilt from the target
+    route, so it can hold a single view. Popping that one would leave an
+    empty stack; the main page is shown instead.
+    
+    Args:
+        page: The Flet page whose view stack is popped
+    """
+    if len(page.views) > 1:
+        page.views.pop()
+        page.go(page.views[-1].route)
+    else:
+        page.go("/")
+
+
+async def main(page: ft.Page):
     """This is the main function that runs our app.
     
     It sets up the database, handles routing between pages,
     and manages user login state.
     
+    The database connection is opened on a worker thread while the login
+    page is being built, so the two overlap instead of running back to back.
+    
     Args:
         page: The main Flet page that will hold our app
     """
@@ -67,23 +173,22 @@ def main(page: ft.Page):
     page.padding = 0
 
     # Application state
-    current_user: Optional[User] = None
+    current_user: User | None = None
     db_connected = False
     
+    # Rendered views of this session keyed by (route, user ID). These are live
+    # Flet controls rather than rows, so the cache is per session and is
+    # cleared after every write that could change what a view shows.
+    view_cache = TTLCache(maxsize=32, ttl=VIEW_CACHE_TTL)
+    
     # Function to initialize database connection
     def initialize_database():
         nonlocal db_connected
         try:
             # Initialize database connection
-            Database.initialize(
-                minconn=1,
-                maxconn=10,
-                database=os.getenv("DB_NAME", "bgg_flashcards"),
-                user=os.getenv("DB_USER"),
-                password=os.getenv("DB_PASSWORD"),
-                host=os.getenv("DB_HOST", "localhost"),
-                port=os.getenv("DB_PORT", "5432")
-            )
+            # Pool sizes come from DB_POOL_MIN / DB_POOL_MAX; the minconn
+            # connections are opened and pinged up front by initialize()
+            Database.initialize(**database_settings())
             db_connected = True
             return True
         except DatabaseError:
@@ -92,9 +197,185 @@ def main(page: ft.Page):
             print("Failed to connect to database")
             return False
     
-    # Initialize database on startup
-    initialize_database()
+    # Initialize database on startup, off the event loop
+    init_task = asyncio.create_task(asyncio.to_thread(initialize_database))
+
 
+    def drop_views():
+        """Forget the cached and stacked views after a write so they are rebuilt."""
+        view_cache.clear()
+        page.views.clear()
+
+    def go_after_write(route):
+        """Drop the stale views, then navigate so the target view is rebuilt."""
+        drop_views()
+        page.go(route)
+
+    def retry_database(_):
+        """Retry the database connection from the error view."""
+        if initialize_database():
+            page.views.clear()
+            page.go("/login")
+        else:
+            db_error_details.value = Database.get_connection_error() or ""
+            page.update()
+
+    # Shown instead of any route while the database is unreachable. Built once
+    # and re-shown on every failed navigation; only the details text changes.
+    db_error_details = ft.Text(selectable=True)
+    db_error_view = ft.View(
+        route="/db_error",
+        controls=[
+            ft.Text("Could not connect to the database", size=20, weight=ft.FontWeight.BOLD),
+            db_error_details,
+            ft.ElevatedButton("Retry", icon=ft.Icons.REFRESH, on_click=retry_database),
+        ],
+        vertical_alignment=ft.MainAxisAlignment.CENTER,
+        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+    )
+
+    # Navigation callbacks shared by every view that links to these routes
+    go_home = functools.partial(page.go, "/")
+    go_search = functools.partial(page.go, "/search")
+    go_home_after_write = functools.partial(go_after_write, "/")
+
+    def show_login():
+        return ft.View(
+            route="/login",
+            controls=[auth_page.build()],
+            vertical_alignment=ft.MainAxisAlignment.CENTER,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
+    # Post-login page constructors with the session-wide arguments (page, user,
+    # shared callbacks) already bound; filled in by bind_page_factories()
+    page_factories = {}
+
+    def bind_page_factories(user):
+        """Bind the constructor arguments that stay fixed for a logged-in session.
+        
+        The page modules are imported here, after login, so the login page
+        never pays for them.
+        
+        Args:
+            user: The User object that just logged in
+        """
+        from pages.main_page import MainPage
+        from pages.game_search_page import GameSearchPage
+        from pages.game_detail_page import GameDetailPage
+        from pages.create_flashcard_page import CreateFlashcardPage
+        
+        page_factories.update(
+            main=functools.partial(
+                MainPage,
+                page=page,
+                user=user,
+                on_game_select=lambda selected_game_id: page.go(f"/game/{selected_game_id}"),
+                on_add_game=go_search,
+                on_logout=logout
+            ),
+            search=functools.partial(
+                GameSearchPage,
+                page=page,
+                user=user,
+                on_save_game=go_home_after_write,
+                on_back=go_home
+            ),
+            create_flashcard=functools.partial(CreateFlashcardPage, page=page, user_id=user.id),
+            edit_flashcard=functools.partial(CreateFlashcardPage, page=page),
+            game_detail=functools.partial(
+                GameDetailPage,
+                page=page,
+                user_id=user.id,
+                user=user,
+                on_create_flashcard=lambda selected_game_id, selected_category: page.go(f"/game/{selected_game_id}/create_flashcard/{selected_category}"),
+                on_back=go_home,
+                on_remove=drop_views
+            ),
+        )
+
+    def show_main():
+        # Main page with user's saved games
+        main_page = page_factories["main"]()
+        return ft.View(
+            route="/",
+            controls=[main_page.build()],
+        )
+
+    def show_search():
+        # Game search page
+        search_page = page_factories["search"]()
+        return ft.View(
+            route="/search",
+            controls=[search_page.build()],
+        )
+
+    def show_create_flashcard(game_id, category):
+        # Create flashcard page with category
+        game_id = int(game_id)
+        game_route = f"/game/{game_id}"
+        
+        create_page = page_factories["create_flashcard"](
+            game_id=game_id,
+            default_category=category,
+            on_save=functools.partial(go_after_write, game_route),
+            on_back=functools.partial(page.go, game_route)
+        )
+        return ft.View(
+            route=f"{game_route}/create_flashcard/{category}",
+            controls=[create_page.build()],
+        )
+
+    def show_edit_flashcard(game_id, flashcard_id):
+        # Edit flashcard page - CreateFlashcardPage in edit mode
+        game_route = f"/game/{int(game_id)}"  # Game route is needed for navigation
+        flashcard_id = int(flashcard_id)
+        
+        edit_page = page_factories["edit_flashcard"](
+            flashcard_id=flashcard_id,
+            on_save=functools.partial(go_after_write, game_route),
+            on_back=functools.partial(page.go, game_route)
+        )
+        return ft.View(
+            route=f"{game_route}/flashcard/{flashcard_id}/edit_flashcard",
+            controls=[edit_page.build()],
+        )
+
+    def show_game_detail(game_id):
+        # Game detail page with flashcards
+        game_id = int(game_id)
+        game_route = f"/game/{game_id}"
+        
+        game_page = page_factories["game_detail"](
+            game_id=game_id,
+            on_edit_flashcard=lambda selected_flashcard_id: page.go(f"{game_route}/flashcard/{selected_flashcard_id}/edit_flashcard")
+        )
+        return ft.View(
+            route=game_route,
+            controls=[game_page.build()],
+        )
+
+    # Route table: exact routes are a dict lookup, parameterized routes are
+    # tried in order against the precompiled patterns. The flag marks views
+    # that may be served from view_cache (forms are always built fresh).
+    static_routes = {
+        "/login": (show_login, False),
+        "/": (show_main, True),
+        "/search": (show_search, False),
+    }
+    pattern_routes = [
+        (CREATE_FLASHCARD_ROUTE, show_create_flashcard, False),
+        (EDIT_FLASHCARD_ROUTE, show_edit_flashcard, False),
+        (GAME_DETAIL_ROUTE, show_game_detail, True),
+    ]
+
+    def is_parent_route(parent, route):
+        """Tell whether a view for parent stays below route on the view stack."""
+        return parent == "/" or route.startswith(f"{parent}/")
+
+    def view_pop(view):
+        """Handle system back navigation by returning to the view underneath."""
+        pop_view(page)
 
     # Function to handle route changes
     def route_change(route):
@@ -109,122 +390,59 @@ def main(page: ft.Page):
         # If database is not connected, show an error message
         if not db_connected:
             print("Database is not connected")
-            # Just go to login page instead of error page
-            page.go("/login")
+            db_error_details.value = Database.get_connection_error() or ""
+            page.views.clear()
+            page.views.append(db_error_view)
+            page.update()
             return
             
-        page.views.clear()
-            
         if not current_user and route.route != "/login":
             # Redirect to log in if not authenticated
             page.go("/login")
             return
 
+        # Views form a stack. Going back to a route that is already on the
+        # stack pops the views above it instead of rebuilding it.
+        for index, stacked_view in enumerate(page.views):
+            if stacked_view.route == route.route:
+                del page.views[index + 1:]
+                page.update()
+                return
+        
+        # Going forward keeps only the views the new route is nested under
+        stack_size = len(page.views)
         if route.route == "/login":
-            page.views.append(
-                ft.View(
-                    route="/login",
-                    controls=[auth_page.build()],
-                    vertical_alignment=ft.MainAxisAlignment.CENTER,
-                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                )
-            )
-        elif route.route == "/":
-            # Main page with user's saved games
-            main_page = MainPage(
-                page=page,
-                user=current_user,
-                on_game_select=lambda selected_game_id: page.go(f"/game/{selected_game_id}"),
-                on_add_game=lambda: page.go("/search"),
-                on_logout=logout
-            )
-            page.views.append(
-                ft.View(
-                    route="/",
-                    controls=[main_page.build()],
-                )
-            )
-        elif route.route == "/search":
-            # Game search page
-            search_page = GameSearchPage(
-                page=page,
-                user=current_user,
-                on_save_game=lambda: page.go("/"),
-                on_back=lambda: page.go("/")
-            )
-            page.views.append(
-                ft.View(
-                    route="/search",
-                    controls=[search_page.build()],
-                )
-            )
-
-        elif route.route.startswith("/game/") and "/create_flashcard/" in route.route:
-            # Create flashcard page with category
-            # Extract the game_id and category from the route
-            path_parts = route.route.split("/")
-            game_id = int(path_parts[-3])  # Game ID is now third-to-last
-            category = path_parts[-1]  # Category is now the last part
-            
-            # Type assertion for PyCharm
-            assert current_user is not None, "User must be logged in"
-            
-            create_page = CreateFlashcardPage(
-                page=page,
-                game_id=game_id,
-                user_id=current_user.id,
-                default_category=category,
-                on_save=lambda: page.go(f"/game/{game_id}"),
-                on_back=lambda: page.go(f"/game/{game_id}")
-            )
-            page.views.append(
-                ft.View(
-                    route=f"/game/{game_id}/create_flashcard/{category}",
-                    controls=[create_page.build()],
-                )
-            )
-
-        elif route.route.startswith("/game/") and route.route.endswith("/edit_flashcard"):
-            # Edit flashcard page - now using CreateFlashcardPage in edit mode
-            # Extract the id from the route
-            parts = route.route.split("/")
-            flashcard_id = int(parts[-2])
-            game_id = int(parts[-4])  # Game ID is needed for navigation
-            
-            edit_page = CreateFlashcardPage(
-                page=page,
-                flashcard_id=flashcard_id,
-                on_save=lambda: page.go(f"/game/{game_id}"),
-                on_back=lambda: page.go(f"/game/{game_id}")
-            )
-            page.views.append(
-                ft.View(
-                    route=f"/game/{game_id}/flashcard/{flashcard_id}/edit_flashcard",
-                    controls=[edit_page.build()],
-                )
-            )
-        elif route.route.startswith("/game/") and not route.route.endswith("/create_flashcard") and not route.route.endswith("/edit_flashcard"):
-            # Game detail page with flashcards
-            game_id = int(route.route.split("/")[-1])
-            # Type assertion for PyCharm
-            assert current_user is not None, "User must be logged in"
+            page.views.clear()
+        else:
+            page.views[:] = [stacked_view for stacked_view in page.views
+                             if is_parent_route(stacked_view.route, route.route)]
+
+        # Reuse a recently rendered view of this route if there is one
+        cache_key = (route.route, current_user.id if current_user else None)
+        view = view_cache.get(cache_key)
+        
+        # Otherwise match the route once and build its view from the captured parameters
+        if view is None:
+            static_route = static_routes.get(route.route)
+            if static_route:
+                show_view, cacheable = static_route
+                view = show_view()
+            else:
+                for pattern, show_view, cacheable in pattern_routes:
+                    match = pattern.match(route.route)
+                    if match:
+                        view = show_view(*match.groups())
+                        break
             
-            game_page = GameDetailPage(
-                page=page,
-                game_id=game_id,
-                user_id=current_user.id,
-                on_create_flashcard=lambda selected_game_id, selected_category: page.go(f"/game/{selected_game_id}/create_flashcard/{selected_category}"),
-                on_edit_flashcard=lambda selected_flashcard_id: page.go(f"/game/{game_id}/flashcard/{selected_flashcard_id}/edit_flashcard"),
-                on_back=lambda: page.go("/")
-            )
-            page.views.append(
-                ft.View(
-                    route=f"/game/{game_id}",
-                    controls=[game_page.build()],
-                )
-            )
-
-        page.update()
+            if view is not None and cacheable:
+                view_cache.set(cache_key, view)
+        
+        if view is not None:
+            page.views.append(view)
+
+        # Only sync with the client when the view stack actually changed
+        if view is not None or len(page.views) != stack_size:
+            page.update()
 
     def logout():
         """Log out the current user and return to the login page.
@@ -233,6 +451,8 @@ def main(page: ft.Page):
         """
         nonlocal current_user
         current_user = None
+        view_cache.clear()
+        page_factories.clear()
         page.go("/login")
 
     def on_login(user):
@@ -253,12 +473,37 @@ def main(page: ft.Page):
                 return
         
         current_user = user
+        bind_page_factories(user)
         page.go("/")
 
+    # Built while the database connection is being established
     auth_page = AuthPage(page, on_login)
 
     page.on_route_change = route_change
+    page.on_view_pop = view_pop
+    
+    # Paint a progress indicator right away instead of a blank window while
+    # the connection is being established
+    page.views.clear()
+    page.views.append(
+        ft.View(
+            route="/connecting",
+            controls=[ft.ProgressRing(), ft.Text("Connecting to database...")],
+            vertical_alignment=ft.MainAxisAlignment.CENTER,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+    )
+    page.update()
+    
+    # Show the login page, or the database error view if the connection failed
+    await init_task
     page.go("/login")
 
 
-ft.app(target=main)
\ No newline at end of file
+if __name__ == "__main__":
+    # Opt-in hashing benchmark; it runs beside the UI so it never delays the first window
+    if os.getenv("MEASURE_HASH_TIME") == "1":
+        logging.basicConfig(level=logging.INFO)
+        threading.Thread(target=log_hash_time, name="measure-hash-time", daemon=True).start()
+
+    ft.app(target=main)
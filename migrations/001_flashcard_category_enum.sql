@@ -0,0 +1,46 @@
+-- Store flashcards.category as the flashcard_category ENUM.
+--
+-- For databases created before the ENUM, where category is a VARCHAR with a
+-- CHECK constraint; postgres_db.sql already creates the ENUM column on fresh
+-- installs. Flashcard.update_many casts to flashcard_category and fails until
+-- this has run.
+--
+-- The ALTER rewrites the flashcards table under an ACCESS EXCLUSIVE lock, so
+-- run it while the application is stopped:
+--     psql -d bgg_flashcards -v ON_ERROR_STOP=1 -f migrations/001_flashcard_category_enum.sql
+-- Safe to run again: every step is skipped or a no-op once applied.
+
+BEGIN;
+
+-- Stop before changing anything if a row holds a category the ENUM lacks;
+-- fix those rows first, the cast below would fail on them
+DO $$
+DECLARE
+    unknown_categories TEXT;
+BEGIN
+    SELECT string_agg(DISTINCT quote_literal(category::text), ', ') INTO unknown_categories
+    FROM flashcards
+    WHERE category::text NOT IN ('Setup', 'Rules', 'Events', 'Points', 'End of the game', 'Notes');
+    
+    IF unknown_categories IS NOT NULL THEN
+        RAISE EXCEPTION 'flashcards.category has values outside flashcard_category: %', unknown_categories;
+    END IF;
+END
+$$;
+
+-- Same declaration (and so sort order) as in postgres_db.sql
+DO $$
+BEGIN
+    CREATE TYPE flashcard_category AS ENUM ('Setup', 'Rules', 'Events', 'Points', 'End of the game', 'Notes');
+EXCEPTION
+    WHEN duplicate_object THEN NULL;
+END
+$$;
+
+-- The ENUM itself now restricts the values; the CHECK would compare an ENUM
+-- with text and is dropped first
+ALTER TABLE flashcards DROP CONSTRAINT IF EXISTS flashcards_category_check;
+ALTER TABLE flashcards
+    ALTER COLUMN category TYPE flashcard_category USING category::text::flashcard_category;
+
+COMMIT;
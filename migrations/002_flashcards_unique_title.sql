@@ -0,0 +1,60 @@
+-- Enforce one flashcard title per user and game.
+--
+-- For databases created before idx_flashcards_game_user_title existed;
+-- postgres_db.sql already creates it on fresh installs. Creating a flashcard
+-- (Flashcard.save_or_append, INSERT ... ON CONFLICT (game_id, user_id, title))
+-- fails until this has run.
+--
+-- Run with psql, outside an explicit transaction (the index is built
+-- CONCURRENTLY, so reads and writes keep working meanwhile):
+--     psql -d bgg_flashcards -v ON_ERROR_STOP=1 -f migrations/002_flashcards_unique_title.sql
+-- If the index build fails because a duplicate was saved in between, just
+-- run the script again: it merges the new duplicate and rebuilds the index.
+
+-- 1. Merge duplicate titles the way save_or_append would have: the contents
+--    are joined oldest first with an empty line between them into the oldest
+--    card, which takes the category and privacy of the newest one. The other
+--    cards are then deleted. The lock keeps new duplicates out while merging
+--    but still allows reads.
+BEGIN;
+
+LOCK TABLE flashcards IN SHARE ROW EXCLUSIVE MODE;
+
+WITH duplicates AS (
+    SELECT game_id, user_id, title,
+           min(id) AS keep_id,
+           string_agg(content, E'\n\n' ORDER BY created_at, id) AS content,
+           (array_agg(category ORDER BY created_at DESC, id DESC))[1] AS category,
+           (array_agg(is_private ORDER BY created_at DESC, id DESC))[1] AS is_private
+    FROM flashcards
+    -- A unique index treats NULLs as distinct, so these never conflict
+    WHERE game_id IS NOT NULL AND user_id IS NOT NULL
+    GROUP BY game_id, user_id, title
+    HAVING count(*) > 1
+), merged AS (
+    UPDATE flashcards
+    SET content = duplicates.content,
+        category = duplicates.category,
+        is_private = duplicates.is_private
+    FROM duplicates
+    WHERE flashcards.id = duplicates.keep_id
+)
+DELETE FROM flashcards
+USING duplicates
+WHERE flashcards.game_id = duplicates.game_id
+  AND flashcards.user_id = duplicates.user_id
+  AND flashcards.title = duplicates.title
+  AND flashcards.id <> duplicates.keep_id;
+
+COMMIT;
+
+-- 2. Drop the invalid index a failed CONCURRENTLY build leaves behind, which
+--    IF NOT EXISTS below would otherwise mistake for a finished one
+SELECT 'DROP INDEX CONCURRENTLY idx_flashcards_game_user_title'
+FROM pg_index
+WHERE indexrelid = to_regclass('idx_flashcards_game_user_title') AND NOT indisvalid
+\gexec
+
+-- 3. Build the unique index without blocking writes
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_flashcards_game_user_title
+    ON flashcards (game_id, user_id, title);
@@ -12,7 +12,121 @@ The Flashcard class provides functionality for:
 - Database CRUD operations
 """
 
-from database import CursorFromConnectionPool
+import csv
+import io
+from psycopg2 import errors
+from psycopg2.extras import execute_values
+from database import CursorFromConnectionPool, Database, optional_cursor
+from utils.ttl_cache import TTLCache
+
+# Recently loaded flashcard rows keyed by flashcard ID (the edit page reloads
+# its card on every visit); invalidated by update() and delete_by_id()
+_flashcard_cache = TTLCache(maxsize=10000, ttl=60)
+
+# Selected columns in Flashcard constructor order, so a row maps straight onto cls(*row)
+_COLUMNS = 'game_id, user_id, category, title, content, id, is_private'
+
+# SQL sent as plain text (not prepared), built once at import time as bytes so
+# psycopg2 sends it without re-encoding the query string on every call
+_SQL_INSERT_MANY = (
+    b'INSERT INTO flashcards (game_id, user_id, category, title, content, is_private) '
+    b'VALUES %s RETURNING id'
+)
+_SQL_SELECT_BY_GAME = b'SELECT ' + _COLUMNS.encode()
+_SQL_ORDER_BY_GAME = b' ORDER BY category, created_at, id'
+_SQL_WHERE_VISIBLE = b' FROM flashcards WHERE game_id = %s AND (is_private = FALSE OR user_id = %s)'
+_SQL_WHERE_PUBLIC = b' FROM flashcards WHERE game_id = %s AND is_private = FALSE'
+_SQL_AFTER_KEY = b' AND (category, created_at, id) > (%s, %s, %s)'
+
+# Bulk import: reserve IDs from the serial sequence, then COPY rows with them.
+# csv.writer leaves empty strings unquoted, which COPY reads as NULL;
+# FORCE_NOT_NULL keeps an empty title or content an empty string, as in save_to_db()
+_SQL_RESERVE_IDS = (
+    b"SELECT nextval(pg_get_serial_sequence('flashcards', 'id')) FROM generate_series(1, %s)"
+)
+_SQL_COPY_IN = (
+    'COPY flashcards (id, game_id, user_id, category, title, content, is_private) '
+    'FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL (title, content))'
+)
+
+# Multi-row UPDATE joined against a VALUES list; ownership is checked per row
+_SQL_UPDATE_MANY = (
+    b'UPDATE flashcards SET category = v.category, title = v.title, '
+    b'content = v.content, is_private = v.is_private '
+    b'FROM (VALUES %s) AS v (id, user_id, category, title, content, is_private) '
+    b'WHERE flashcards.id = v.id AND flashcards.user_id = v.user_id '
+    b'RETURNING flashcards.id'
+)
+
+# Server-side cursor queries for iter_by_game_id
+_SQL_ITER_VISIBLE = _SQL_SELECT_BY_GAME + _SQL_WHERE_VISIBLE + _SQL_ORDER_BY_GAME
+_SQL_ITER_PUBLIC = _SQL_SELECT_BY_GAME + _SQL_WHERE_PUBLIC + _SQL_ORDER_BY_GAME
+
+# Keyset page queries for get_page_by_game_id, keyed by (has_user, has_after_key)
+_SQL_PAGE = {
+    (has_user, has_after): (
+        _SQL_SELECT_BY_GAME + b', created_at'
+        + (_SQL_WHERE_VISIBLE if has_user else _SQL_WHERE_PUBLIC)
+        + (_SQL_AFTER_KEY if has_after else b'')
+        + _SQL_ORDER_BY_GAME + b' LIMIT %s'
+    )
+    for has_user in (False, True)
+    for has_after in (False, True)
+}
+
+Database.register_prepared_statement(
+    'flashcard_insert',
+    'INSERT INTO flashcards (game_id, user_id, category, title, content, is_private) '
+    'VALUES ($1, $2, $3, $4, $5, $6) RETURNING id'
+)
+Database.register_prepared_statement(
+    'flashcard_save_or_append',
+    'INSERT INTO flashcards (game_id, user_id, category, title, content, is_private) '
+    'VALUES ($1, $2, $3, $4, $5, $6) '
+    'ON CONFLICT (game_id, user_id, title) DO UPDATE SET '
+    "content = flashcards.content || E'\\n\\n' || EXCLUDED.content, "
+    'category = EXCLUDED.category, is_private = EXCLUDED.is_private '
+    'RETURNING id, content, xmax = 0'
+)
+Database.register_prepared_statement(
+    'flashcard_update',
+    'UPDATE flashcards SET category = $1, title = $2, content = $3, is_private = $4 '
+    'WHERE id = $5 AND user_id = $6'
+)
+Database.register_prepared_statement(
+    'flashcard_delete',
+    'DELETE FROM flashcards WHERE id = $1 RETURNING id'
+)
+Database.register_prepared_statement(
+    'flashcard_delete_owned',
+    'DELETE FROM flashcards WHERE id = $1 AND user_id = $2 RETURNING id'
+)
+Database.register_prepared_statement(
+    'flashcard_load_by_id',
+    'SELECT ' + _COLUMNS + ' FROM flashcards WHERE id = $1'
+)
+Database.register_prepared_statement(
+    'flashcard_load_many',
+    'SELECT ' + _COLUMNS + ' FROM flashcards '
+    'WHERE id = ANY($1::integer[])'
+)
+Database.register_prepared_statement(
+    'flashcard_find_by_game_user_title',
+    'SELECT ' + _COLUMNS + ' FROM flashcards '
+    'WHERE game_id = $1 AND user_id = $2 AND title = $3'
+)
+Database.register_prepared_statement(
+    'flashcard_get_by_game_id',
+    'SELECT ' + _COLUMNS + ' FROM flashcards '
+    'WHERE game_id = $1 AND (is_private = FALSE OR user_id = $2) '
+    'ORDER BY category, created_at, id'
+)
+Database.register_prepared_statement(
+    'flashcard_get_public_by_game_id',
+    'SELECT ' + _COLUMNS + ' FROM flashcards '
+    'WHERE game_id = $1 AND is_private = FALSE '
+    'ORDER BY category, created_at, id'
+)
 
 
 class Flashcard:
@@ -38,7 +152,16 @@ class Flashcard:
         - Points: Scoring information
         - End of the game: End game conditions
         - Notes: General notes and tips
+        
+    Note:
+        The class declares __slots__, so instances carry no per-object
+        __dict__; get_by_game_id can build hundreds of them per game page.
     """
+    __slots__ = ('id', 'game_id', 'user_id', 'category', 'title', 'content', 'is_private')
+
+    # Allowed categories in display order (matches the flashcard_category ENUM)
+    CATEGORIES = ('Setup', 'Rules', 'Events', 'Points', 'End of the game', 'Notes')
+
     def __init__(self, game_id, user_id, category, title, content, id=None, is_private=False):
         """Initialize a new Flashcard instance.
         
@@ -59,28 +182,144 @@ class Flashcard:
         self.content = content
         self.is_private = is_private
 
-    def save_to_db(self):
+    def save_to_db(self, cursor=None):
         """Save the flashcard to the database.
         
         Inserts a new flashcard record with all current attribute values.
         The flashcard's ID will be set to the new database primary key.
         
+        Args:
+            cursor (psycopg2.cursor, optional): Cursor of the caller's open
+                transaction. Defaults to a new pooled cursor.
+            
         Returns:
             int: The flashcard's database ID
             
         Raises:
             DatabaseError: If database operation fails
         """
-        with CursorFromConnectionPool() as cursor:
-            cursor.execute('''
-                INSERT INTO flashcards (game_id, user_id, category, title, content, is_private) 
-                VALUES (%s, %s, %s, %s, %s, %s) RETURNING id
-            ''', (self.game_id, self.user_id, self.category, self.title, self.content, self.is_private))
+        with optional_cursor(cursor) as cursor:
+            Database.execute_prepared(
+                cursor, 'flashcard_insert',
+                (self.game_id, self.user_id, self.category, self.title, self.content, self.is_private))
             self.id = cursor.fetchone()[0]
             return self.id
     
+    def save_or_append(self, cursor=None):
+        """Save the flashcard, appending to the user's card with the same title.
+        
+        A single INSERT ... ON CONFLICT statement either inserts a new
+        flashcard or, if this user already has a flashcard with this title
+        for the game, appends this content to it (separated by an empty line)
+        and takes over this category and privacy setting. The check and the
+        write are atomic, so concurrent saves cannot create duplicates.
+        
+        Args:
+            cursor (psycopg2.cursor, optional): Cursor of the caller's open
+                transaction. Defaults to a new pooled cursor.
+            
+        Returns:
+            bool: True if a new flashcard was created, False if the content
+                was appended to an existing one. In both cases id and content
+                are set to the stored values.
+            
+        Raises:
+            DatabaseError: If database operation fails
+            
+        Note:
+            ON CONFLICT needs the unique index idx_flashcards_game_user_title;
+            databases created before it need
+            migrations/002_flashcards_unique_title.sql.
+        """
+        with optional_cursor(cursor) as cursor:
+            Database.execute_prepared(
+                cursor, 'flashcard_save_or_append',
+                (self.game_id, self.user_id, self.category, self.title, self.content, self.is_private))
+            self.id, self.content, inserted = cursor.fetchone()
+        if not inserted:
+            _flashcard_cache.pop(self.id)
+        return inserted
+    
     @classmethod
-    def find_by_game_user_title(cls, game_id, user_id, title):
+    def save_many(cls, flashcards, cursor=None):
+        """Save several new flashcards to the database in one statement.
+        
+        Inserts all flashcards with a single multi-row INSERT (sent in pages
+        of 500 rows) instead of one round-trip per flashcard. Each flashcard's
+        ID is set to its new database primary key.
+        
+        Args:
+            flashcards (list[Flashcard]): New flashcards to insert
+            cursor (psycopg2.cursor, optional): Cursor of the caller's open
+                transaction. Defaults to a new pooled cursor.
+            
+        Returns:
+            list[int]: The new flashcard IDs, in the order of flashcards
+            
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if not flashcards:
+            return []
+            
+        with optional_cursor(cursor) as cursor:
+            rows = execute_values(
+                cursor,
+                _SQL_INSERT_MANY,
+                [(flashcard.game_id, flashcard.user_id, flashcard.category, flashcard.title,
+                  flashcard.content, flashcard.is_private) for flashcard in flashcards],
+                page_size=500,
+                fetch=True
+            )
+            
+        for flashcard, (flashcard_id,) in zip(flashcards, rows):
+            flashcard.id = flashcard_id
+        return [flashcard.id for flashcard in flashcards]
+    
+    @classmethod
+    def bulk_copy(cls, flashcards, cursor=None):
+        """Import a large number of new flashcards with PostgreSQL COPY.
+        
+        Intended for importing whole card decks. COPY streams the rows in a
+        single CSV payload and skips per-statement parsing and planning, so
+        it is much faster than save_many() for thousands of rows. IDs are
+        reserved from the table's sequence first (one query), so each
+        flashcard's ID is known without a staging table.
+        
+        Args:
+            flashcards (list[Flashcard]): New flashcards to import
+            cursor (psycopg2.cursor, optional): Cursor of the caller's open
+                transaction. Defaults to a new pooled cursor.
+            
+        Returns:
+            list[int]: The new flashcard IDs, in the order of flashcards
+            
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if not flashcards:
+            return []
+            
+        with optional_cursor(cursor) as cursor:
+            cursor.execute(_SQL_RESERVE_IDS, (len(flashcards),))
+            flashcard_ids = [flashcard_id for flashcard_id, in cursor]
+            
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerows(
+                (flashcard_id, flashcard.game_id, flashcard.user_id, flashcard.category,
+                 flashcard.title, flashcard.content, flashcard.is_private)
+                for flashcard_id, flashcard in zip(flashcard_ids, flashcards)
+            )
+            buffer.seek(0)
+            cursor.copy_expert(_SQL_COPY_IN, buffer)
+            
+        for flashcard, flashcard_id in zip(flashcards, flashcard_ids):
+            flashcard.id = flashcard_id
+        return flashcard_ids
+    
+    @classmethod
+    def find_by_game_user_title(cls, game_id, user_id, title, cursor=None):
         """Find a flashcard by game ID, user ID, and title.
         
         Used to check for existing flashcards before creating new ones,
@@ -90,6 +329,8 @@ class Flashcard:
             game_id (int): The ID of the game
             user_id (int): The ID of the user  
             title (str): The exact title of the flashcard
+            cursor (psycopg2.cursor, optional): Cursor of the caller's open
+                transaction. Defaults to a new pooled cursor.
             
         Returns:
             Flashcard: Flashcard object if found, None otherwise
@@ -97,21 +338,16 @@ class Flashcard:
         Note:
             This search is case-sensitive and requires exact title match.
         """
-        with CursorFromConnectionPool() as cursor:
-            cursor.execute('''
-                SELECT id, game_id, user_id, category, title, content, is_private
-                FROM flashcards
-                WHERE game_id = %s AND user_id = %s AND title = %s
-            ''', (game_id, user_id, title))
+        with optional_cursor(cursor) as cursor:
+            Database.execute_prepared(cursor, 'flashcard_find_by_game_user_title', (game_id, user_id, title))
             
             flashcard_data = cursor.fetchone()
             if flashcard_data:
-                id, game_id, user_id, category, title, content, is_private = flashcard_data
-                return cls(game_id, user_id, category, title, content, id, is_private)
+                return cls(*flashcard_data)
             return None
 
     @classmethod
-    def get_by_game_id(cls, game_id, current_user_id=None):
+    def get_by_game_id(cls, game_id, current_user_id=None, cursor=None):
         """Get all flashcards for a specific game, respecting privacy settings.
         
         Retrieves flashcards associated with a game, filtering based on privacy
@@ -123,6 +359,8 @@ class Flashcard:
             current_user_id (int, optional): The ID of the current user.
                 If provided, user will see their private flashcards in addition
                 to all public flashcards.
+            cursor (psycopg2.cursor, optional): Cursor of the caller's open
+                transaction. Defaults to a new pooled cursor.
                 
         Returns:
             list[Flashcard]: List of Flashcard objects for the game, ordered by
@@ -133,36 +371,105 @@ class Flashcard:
             - If current_user_id provided: Public flashcards + user's private flashcards
             
         Note:
-            Results are ordered by category first, then by creation time.
+            Results are ordered by category first (in CATEGORIES order),
+            then by creation time.
+            Use get_page_by_game_id() to fetch large card lists page by page,
+            or iter_by_game_id() to stream them.
         """
-        with CursorFromConnectionPool() as cursor:
+        with optional_cursor(cursor) as cursor:
             if current_user_id:
                 # Show public cards + private cards belonging to the current user
-                cursor.execute('''
-                    SELECT id, game_id, user_id, category, title, content, is_private
-                    FROM flashcards
-                    WHERE game_id = %s AND (is_private = FALSE OR user_id = %s)
-                    ORDER BY category, created_at
-                ''', (game_id, current_user_id))
+                Database.execute_prepared(cursor, 'flashcard_get_by_game_id', (game_id, current_user_id))
             else:
                 # Show only public cards
-                cursor.execute('''
-                    SELECT id, game_id, user_id, category, title, content, is_private
-                    FROM flashcards
-                    WHERE game_id = %s AND is_private = FALSE
-                    ORDER BY category, created_at
-                ''', (game_id,))
+                Database.execute_prepared(cursor, 'flashcard_get_public_by_game_id', (game_id,))
 
-            flashcards = []
-            for flashcard_data in cursor.fetchall():
-                id, game_id, user_id, category, title, content, is_private = flashcard_data
-                flashcard = cls(game_id, user_id, category, title, content, id, is_private)
-                flashcards.append(flashcard)
+            # Iterate the cursor directly instead of materializing fetchall() first
+            return [cls(*flashcard_data) for flashcard_data in cursor]
+
+    @classmethod
+    def iter_by_game_id(cls, game_id, current_user_id=None, itersize=500):
+        """Stream all flashcards for a game from a server-side cursor.
+        
+        Generator variant of get_by_game_id() for very large card lists:
+        PostgreSQL keeps the result set and rows arrive itersize at a time,
+        so only one batch is held in memory instead of the whole result.
+        
+        Args:
+            game_id (int): The ID of the game to get flashcards for
+            current_user_id (int, optional): The ID of the current user, to
+                include their private flashcards
+            itersize (int, optional): Rows fetched per network round-trip. Defaults to 500.
+                
+        Yields:
+            Flashcard: Flashcards ordered by category, creation time and ID
+            
+        Note:
+            The pooled connection stays checked out until the generator is
+            exhausted or closed, so consume it promptly. For small games
+            get_by_game_id() is cheaper, as it skips the DECLARE/FETCH
+            round-trips of a named cursor.
+        """
+        with CursorFromConnectionPool(server_side=True, itersize=itersize) as cursor:
+            if current_user_id:
+                cursor.execute(_SQL_ITER_VISIBLE, (game_id, current_user_id))
+            else:
+                cursor.execute(_SQL_ITER_PUBLIC, (game_id,))
+                
+            for flashcard_data in cursor:
+                yield cls(*flashcard_data)
 
-            return flashcards
+    @classmethod
+    def get_page_by_game_id(cls, game_id, after=None, limit=50, current_user_id=None, cursor=None):
+        """Get one page of flashcards for a game using keyset pagination.
+        
+        Same rows and privacy rules as get_by_game_id(), but at most limit
+        flashcards are fetched per call. The next page continues after the
+        (category, created_at, id) key of the previous page's last row, so
+        every page is an index range scan instead of an OFFSET that rescans
+        the skipped rows.
+        
+        Args:
+            game_id (int): The ID of the game to get flashcards for
+            after (tuple, optional): The next_key returned for the previous
+                page. Defaults to None (first page).
+            limit (int, optional): Maximum number of flashcards per page. Defaults to 50.
+            current_user_id (int, optional): The ID of the current user, to
+                include their private flashcards
+            cursor (psycopg2.cursor, optional): Cursor of the caller's open
+                transaction. Defaults to a new pooled cursor.
+                
+        Returns:
+            tuple: (flashcards, next_key) where flashcards is a list[Flashcard]
+                and next_key is the value to pass as after for the next page,
+                or None when this was the last page
+                
+        Example:
+            flashcards, next_key = Flashcard.get_page_by_game_id(game_id)
+            while next_key:
+                more, next_key = Flashcard.get_page_by_game_id(game_id, after=next_key)
+        """
+        params = [game_id]
+        if current_user_id:
+            params.append(current_user_id)
+        if after is not None:
+            params.extend(after)
+        params.append(limit)
+        
+        with optional_cursor(cursor) as cursor:
+            cursor.execute(_SQL_PAGE[bool(current_user_id), after is not None], params)
+            rows = cursor.fetchall()
+            
+        # Rows are the constructor columns followed by created_at for the keyset
+        flashcards = [cls(*flashcard_data[:-1]) for flashcard_data in rows]
+        next_key = None
+        if len(rows) == limit:
+            last = flashcards[-1]
+            next_key = (last.category, rows[-1][-1], last.id)
+        return flashcards, next_key
 
     @classmethod
-    def delete_by_id(cls, flashcard_id):
+    def delete_by_id(cls, flashcard_id, user_id=None, cursor=None):
         """Delete a flashcard from the database.
         
         Permanently removes the flashcard record from the database.
@@ -170,9 +477,15 @@ class Flashcard:
         
         Args:
             flashcard_id (int): The ID of the flashcard to delete
+            user_id (int, optional): If provided, the flashcard is only deleted
+                when it belongs to this user. The ownership check is part of
+                the DELETE itself, so it costs no extra round-trip.
+            cursor (psycopg2.cursor, optional): Cursor of the caller's open
+                transaction. Defaults to a new pooled cursor.
             
         Returns:
-            bool: True if deletion was successful
+            int: The ID of the deleted flashcard (from DELETE ... RETURNING),
+                or None if it did not exist (or is not owned by user_id)
             
         Raises:
             DatabaseError: If database operation fails
@@ -180,53 +493,170 @@ class Flashcard:
         Warning:
             This operation is permanent and cannot be undone.
         """
-        with CursorFromConnectionPool() as cursor:
-            cursor.execute('DELETE FROM flashcards WHERE id = %s', (flashcard_id,))
-            return True
+        with optional_cursor(cursor) as cursor:
+            if user_id is None:
+                Database.execute_prepared(cursor, 'flashcard_delete', (flashcard_id,))
+            else:
+                Database.execute_prepared(cursor, 'flashcard_delete_owned', (flashcard_id, user_id))
+            deleted = cursor.fetchone()
+        _flashcard_cache.pop(flashcard_id)
+        return deleted[0] if deleted else None
             
     @classmethod
-    def load_by_id(cls, flashcard_id):
+    def load_by_id(cls, flashcard_id, cursor=None):
         """Load a flashcard from the database by its ID.
         
         Args:
             flashcard_id (int): The database ID to search for
+            cursor (psycopg2.cursor, optional): Cursor of the caller's open
+                transaction. Defaults to a new pooled cursor.
             
         Returns:
             Flashcard: Flashcard object if found, None otherwise
             
         Note:
             This loads the complete flashcard with all attributes including
-            privacy settings.
+            privacy settings. Rows are cached in memory for 60 seconds; a
+            call with the caller's cursor always reads from the database so
+            it sees that transaction's own writes.
         """
-        with CursorFromConnectionPool() as cursor:
-            cursor.execute('SELECT game_id, user_id, category, title, content, is_private FROM flashcards WHERE id = %s',
-                           (flashcard_id,))
-            flashcard_data = cursor.fetchone()
-            if flashcard_data:
-                game_id, user_id, category, title, content, is_private = flashcard_data
-                return cls(game_id, user_id, category, title, content, flashcard_id, is_private)
-            return None
+        flashcard_data = _flashcard_cache.get(flashcard_id) if cursor is None else None
+        if flashcard_data is None:
+            with optional_cursor(cursor) as active_cursor:
+                Database.execute_prepared(active_cursor, 'flashcard_load_by_id', (flashcard_id,))
+                flashcard_data = active_cursor.fetchone()
+            if flashcard_data is None:
+                return None
+            if cursor is None:
+                _flashcard_cache.set(flashcard_id, flashcard_data)
+                
+        return cls(*flashcard_data)
+
+    @classmethod
+    def load_many(cls, flashcard_ids, cursor=None):
+        """Load several flashcards from the database in one query.
+        
+        Use this instead of calling load_by_id() in a loop: all rows are
+        fetched with a single ``id = ANY(...)`` lookup and one round-trip.
+        
+        Args:
+            flashcard_ids (iterable[int]): The database IDs to load
+            cursor (psycopg2.cursor, optional): Cursor of the caller's open
+                transaction. Defaults to a new pooled cursor.
             
-    def update(self):
+        Returns:
+            list[Flashcard]: The flashcards found, in the order of flashcard_ids.
+                IDs that do not exist are skipped.
+        """
+        flashcard_ids = list(flashcard_ids)
+        if not flashcard_ids:
+            return []
+            
+        with optional_cursor(cursor) as cursor:
+            Database.execute_prepared(cursor, 'flashcard_load_many', (flashcard_ids,))
+            flashcards = [cls(*flashcard_data) for flashcard_data in cursor]
+        flashcards = {flashcard.id: flashcard for flashcard in flashcards}
+        return [flashcards[flashcard_id] for flashcard_id in flashcard_ids if flashcard_id in flashcards]
+            
+    def update(self, cursor=None):
         """Update the existing flashcard record in the database.
         
         Updates all modifiable fields (category, title, content, is_private)
         for the flashcard with the current ID. The flashcard must already
         exist in the database.
         
+        Args:
+            cursor (psycopg2.cursor, optional): Cursor of the caller's open
+                transaction. Defaults to a new pooled cursor.
+            
         Returns:
-            bool: True if update was successful
+            bool: True if the flashcard was updated, False if it no longer
+                exists, is no longer owned by this flashcard's user_id, or the
+                user already has another flashcard with this title for the game
             
         Raises:
             DatabaseError: If database operation fails
             
         Note:
             The flashcard's ID, game_id, and user_id cannot be changed.
+            Ownership is checked in the UPDATE's WHERE clause, so there is
+            no separate SELECT and no window between check and write.
+            With a caller's cursor, the UPDATE runs inside a savepoint so a
+            title conflict only undoes this statement and the caller's
+            transaction stays usable.
+        """
+        if cursor is None:
+            try:
+                with optional_cursor() as cursor:
+                    updated = self._execute_update(cursor)
+            except errors.UniqueViolation:
+                # Renamed onto the title of another of the user's cards
+                updated = False
+        else:
+            cursor.execute('SAVEPOINT flashcard_update')
+            try:
+                updated = self._execute_update(cursor)
+            except errors.UniqueViolation:
+                cursor.execute('ROLLBACK TO SAVEPOINT flashcard_update')
+                updated = False
+            else:
+                cursor.execute('RELEASE SAVEPOINT flashcard_update')
+        _flashcard_cache.pop(self.id)
+        return updated
+
+    def _execute_update(self, cursor):
+        """Run the ownership-checked UPDATE for this flashcard.
+        
+        Args:
+            cursor (psycopg2.cursor): Cursor to execute the statement on
+            
+        Returns:
+            bool: True if exactly one row was updated
+        """
+        Database.execute_prepared(
+            cursor, 'flashcard_update',
+            (self.category, self.title, self.content, self.is_private, self.id, self.user_id))
+        return cursor.rowcount == 1
+
+    @classmethod
+    def update_many(cls, flashcards, cursor=None):
+        """Update several existing flashcards in one statement.
+        
+        Sends all new values as one VALUES list joined into a single UPDATE
+        (in pages of 500 rows) instead of one update() round-trip per card.
+        As in update(), a row is only written when it still belongs to the
+        flashcard's user_id.
+        
+        Args:
+            flashcards (list[Flashcard]): Flashcards with their new values
+            cursor (psycopg2.cursor, optional): Cursor of the caller's open
+                transaction. Defaults to a new pooled cursor.
+            
+        Returns:
+            set[int]: IDs of the flashcards that were updated
+            
+        Raises:
+            DatabaseError: If database operation fails
+            
+        Note:
+            The category values are cast to the flashcard_category ENUM;
+            databases created before it need
+            migrations/001_flashcard_category_enum.sql.
         """
-        with CursorFromConnectionPool() as cursor:
-            cursor.execute('''
-                UPDATE flashcards 
-                SET category = %s, title = %s, content = %s, is_private = %s
-                WHERE id = %s
-            ''', (self.category, self.title, self.content, self.is_private, self.id))
-            return True
\ No newline at end of file
+        if not flashcards:
+            return set()
+            
+        with optional_cursor(cursor) as cursor:
+            rows = execute_values(
+                cursor,
+                _SQL_UPDATE_MANY,
+                [(flashcard.id, flashcard.user_id, flashcard.category, flashcard.title,
+                  flashcard.content, flashcard.is_private) for flashcard in flashcards],
+                template='(%s::integer, %s::integer, %s::flashcard_category, %s, %s, %s::boolean)',
+                page_size=500,
+                fetch=True
+            )
+            
+        for flashcard in flashcards:
+            _flashcard_cache.pop(flashcard.id)
+        return {flashcard_id for flashcard_id, in rows}
@@ -10,12 +10,131 @@ The Game class provides functionality for:
 - Local image storage and management
 - Database CRUD operations
 - Background data synchronization
+
+BGG XML is parsed with lxml when it is installed (libxml2 is several times
+faster than the pure-Python tree builder); otherwise the standard library
+ElementTree is used. Both expose the same parse/find/iter API used here.
 """
 
-from database import CursorFromConnectionPool
-import requests
-import xml.etree.ElementTree as Et
+import bisect
+import queue
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from urllib.parse import quote_plus
+from psycopg2.extras import execute_values
+from database import CursorFromConnectionPool, Database, optional_cursor
+from utils.http_session import REQUEST_TIMEOUT, http_session
+try:
+    from lxml import etree as Et
+    _USE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as Et
+    _USE_LXML = False
 from utils.image_service import ImageService
+from utils.ttl_cache import TTLCache
+
+# Recently loaded game rows keyed by game ID, invalidated whenever a game is saved
+_game_cache = TTLCache(maxsize=1024, ttl=60)
+
+# Games recently fetched from BGG (constructor-ordered tuples) keyed by BGG ID.
+# Search, expansion and ID lookups often hit the same IDs within minutes; a hit
+# skips the HTTP request, the XML parse, the database save and the image download.
+_bgg_details_cache = TTLCache(maxsize=1024, ttl=600)
+
+# Local search result rows keyed by lowercased query (ILIKE and the relevance
+# ranking are case-insensitive); cleared whenever any game is saved
+_search_cache = TTLCache(maxsize=256, ttl=45)
+
+# Base64 image payloads (data URI prefix removed) keyed by game ID, so UI
+# re-renders skip the large object read and the encoding; the placeholder
+# image (ID -1) never changes and is kept for PLACEHOLDER_IMAGE_TTL
+_image_base64_cache = TTLCache(maxsize=512, ttl=600)
+PLACEHOLDER_IMAGE_TTL = 24 * 60 * 60
+
+# BGG detail fetches in progress, keyed by BGG ID. A caller that needs an ID
+# another thread is already fetching waits for that Future (which resolves to
+# a constructor-ordered tuple, or None) instead of sending a duplicate request.
+_inflight_bgg_fetches = {}
+_inflight_lock = threading.Lock()
+
+# Background pool for storing BGG images, so detail lookups return without
+# waiting for image downloads (the UI shows the remote URL until then)
+_image_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="bgg-image")
+_pending_images = weakref.WeakSet()
+
+# lxml parsers are reusable but must not be shared between threads, so each
+# BGG worker thread keeps its own (see _xml_parser)
+_thread_local = threading.local()
+
+
+def _xml_parser():
+    """Get this thread's reusable lxml parser.
+    
+    Returns:
+        An lxml XMLParser with entity expansion and network access disabled,
+        or None with the standard library parser (a new one is needed per
+        document, which ElementTree creates itself)
+    """
+    if not _USE_LXML:
+        return None
+    
+    parser = getattr(_thread_local, 'xml_parser', None)
+    if parser is None:
+        # No entity expansion or network access for documents from the web
+        parser = Et.XMLParser(resolve_entities=False, no_network=True)
+        _thread_local.xml_parser = parser
+    return parser
+
+# Follow-up BGG name searches queued after direct ID lookups. One worker thread
+# runs them one at a time, so bursts of lookups never fan out into parallel
+# BGG traffic; names already queued or running are not queued again.
+_name_search_queue = queue.Queue()
+_queued_name_searches = set()
+_name_search_lock = threading.Lock()
+_name_search_worker = None
+
+Database.register_prepared_statement(
+    'game_load_by_id',
+    'SELECT name, avg_rating, min_players, max_players, image_path, id, is_expansion, yearpublished, '
+    'image_oid IS NOT NULL '
+    'FROM games WHERE id = $1'
+)
+Database.register_prepared_statement(
+    'game_upsert',
+    'INSERT INTO games (id, name, avg_rating, min_players, max_players, image_path, is_expansion, yearpublished) '
+    'VALUES ($1, $2, $3, $4, $5, $6, $7, $8) '
+    'ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name, avg_rating = EXCLUDED.avg_rating, '
+    'min_players = EXCLUDED.min_players, max_players = EXCLUDED.max_players, '
+    'image_path = EXCLUDED.image_path, is_expansion = EXCLUDED.is_expansion, '
+    'yearpublished = EXCLUDED.yearpublished'
+)
+# Base games first, then expansions; each sorted by relevance (exact match
+# first, then startswith, then contains) and capped at $4 rows per kind.
+# The ILIKE filter is served by the pg_trgm GIN index on games.name.
+Database.register_prepared_statement(
+    'game_search_by_name',
+    """
+    SELECT name, avg_rating, min_players, max_players, image_path, id, is_expansion, yearpublished, has_image
+    FROM (
+        SELECT name, avg_rating, min_players, max_players, image_path, id, is_expansion, yearpublished,
+               image_oid IS NOT NULL AS has_image,
+               ROW_NUMBER() OVER (
+                   PARTITION BY is_expansion IS TRUE
+                   ORDER BY CASE 
+                                WHEN LOWER(name) = LOWER($1) THEN 1 
+                                WHEN LOWER(name) LIKE LOWER($2) THEN 2 
+                                ELSE 3 
+                            END,
+                            avg_rating DESC NULLS LAST, name
+               ) AS kind_rank
+        FROM games 
+        WHERE name ILIKE $3
+    ) ranked
+    WHERE kind_rank <= $4
+    ORDER BY is_expansion IS TRUE, kind_rank
+    """
+)
 
 
 class Game:
@@ -41,8 +160,37 @@ class Game:
     Private Attributes:
         _source (str): Indicates data source ('Local Database', 'BoardGameGeek', etc.)
         _is_search_data (bool): True if created from BGG search API (basic data only)
+        _has_image (bool): Whether the image is stored locally, as loaded with
+            the game row; None if unknown
+        
+    Class Constants:
+        SEARCH_RESULT_LIMIT: Maximum base games (and, separately, expansions)
+            returned by a local name search
+        BGG_MAX_WORKERS: Maximum concurrent BoardGameGeek detail requests
+            issued by get_bgg_games_details
+        BGG_BATCH_SIZE: Game IDs requested per BGG thing call
+        BGG_SEARCH_URL: BGG XML API search endpoint, formatted with ``query``
+        BGG_THING_URL: BGG XML API thing endpoint (with statistics),
+            formatted with ``ids``
+            
+    Note:
+        The class declares __slots__ because a Game is built for every row of
+        every search. Any new instance attribute, private ones included,
+        must be added there.
     """
-    def __init__(self, name, avg_rating, min_players, max_players, image_path, game_id=None, is_expansion=0, yearpublished=None):
+    __slots__ = (
+        'id', 'name', 'avg_rating', 'min_players', 'max_players', 'image_path',
+        'is_expansion', 'yearpublished', '_source', '_is_search_data', '_has_image',
+    )
+
+    SEARCH_RESULT_LIMIT = 50
+    BGG_MAX_WORKERS = 8
+    BGG_BATCH_SIZE = 20
+    BGG_SEARCH_URL = "https://boardgamegeek.com/xmlapi2/search?query={query}&type=boardgame"
+    BGG_THING_URL = "https://boardgamegeek.com/xmlapi2/thing?id={ids}&stats=1"
+
+    def __init__(self, name, avg_rating, min_players, max_players, image_path, game_id=None, is_expansion=0, yearpublished=None,
+                 has_image=None):
         """Initialize a new Game instance.
         
         Args:
@@ -54,6 +202,8 @@ class Game:
             game_id (int, optional): BoardGameGeek ID. If None, will be auto-assigned
             is_expansion (int, optional): 1 for expansion, 0 for base game. Defaults to 0
             yearpublished (int, optional): Year the game was published
+            has_image (bool, optional): Whether a local image is stored, if
+                already known from the loaded row. Defaults to None (unknown)
         """
         self.id = game_id
         self.name = name
@@ -63,12 +213,14 @@ class Game:
         self.image_path = image_path
         self.is_expansion = 1 if is_expansion else 0  # Store as 0/1 integer
         self.yearpublished = yearpublished
+        self._has_image = has_image
 
     def save_to_db(self):
         """Save the game to the database.
         
         Inserts the game into the games table. If the game already exists
-        (based on game_id/BGG ID), it will be updated instead.
+        (based on game_id/BGG ID), it will be updated instead; both cases are
+        a single INSERT ... ON CONFLICT (id) DO UPDATE statement.
         
         Returns:
             int: The database ID of the saved game
@@ -76,58 +228,96 @@ class Game:
         Raises:
             DatabaseError: If database operation fails
         """
-        with CursorFromConnectionPool() as cursor:
-            if self.id:
-                # If ID is provided, check if game already exists
-                cursor.execute('SELECT id FROM games WHERE id = %s', (self.id,))
-                existing_game = cursor.fetchone()
-                
-                if existing_game:
-                    # Update existing game with new data
-                    cursor.execute('''
-                        UPDATE games 
-                        SET name = %s, avg_rating = %s, min_players = %s, max_players = %s, image_path = %s, 
-                            is_expansion = %s, yearpublished = %s
-                        WHERE id = %s
-                    ''', (self.name, self.avg_rating, self.min_players, self.max_players, self.image_path, 
-                          self.is_expansion, self.yearpublished, self.id))
+        try:
+            with CursorFromConnectionPool() as cursor:
+                if self.id:
+                    # Insert with the provided (BGG) ID, or update the existing row, in one statement
+                    Database.execute_prepared(cursor, 'game_upsert', (
+                        self.id, self.name, self.avg_rating, self.min_players, self.max_players,
+                        self.image_path, self.is_expansion, self.yearpublished))
                     return self.id
                 else:
-                    # Insert new game with provided ID
+                    # Standard insert with auto-generated ID
                     cursor.execute('''
-                        INSERT INTO games (id, name, avg_rating, min_players, max_players, image_path, is_expansion, yearpublished) 
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ''', (self.id, self.name, self.avg_rating, self.min_players, self.max_players, self.image_path, 
+                        INSERT INTO games (name, avg_rating, min_players, max_players, image_path, is_expansion, yearpublished) 
+                        VALUES (%s, %s, %s, %s, %s, %s, %s) RETURNING id
+                    ''', (self.name, self.avg_rating, self.min_players, self.max_players, self.image_path, 
                           self.is_expansion, self.yearpublished))
+                    self.id = cursor.fetchone()[0]
                     return self.id
-            else:
-                # Standard insert with auto-generated ID
-                cursor.execute('''
-                    INSERT INTO games (name, avg_rating, min_players, max_players, image_path, is_expansion, yearpublished) 
-                    VALUES (%s, %s, %s, %s, %s, %s, %s) RETURNING id
-                ''', (self.name, self.avg_rating, self.min_players, self.max_players, self.image_path, 
-                      self.is_expansion, self.yearpublished))
-                self.id = cursor.fetchone()[0]
-                return self.id
+        finally:
+            # Drop the cached row only after the write has been committed
+            if self.id:
+                _game_cache.pop(int(self.id))
+            _search_cache.clear()
 
     @classmethod
-    def load_by_id(cls, game_id):
+    def save_many(cls, games):
+        """Save several games that already have their (BGG) IDs in one statement.
+        
+        Upserts all games with a single multi-row INSERT ... ON CONFLICT (id)
+        DO UPDATE (sent in pages of 100 rows), in one transaction, instead
+        of one save_to_db() round-trip and commit per game.
+        
+        Args:
+            games: Game objects with id set; IDs must be unique within the list
+            
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if not games:
+            return
+        
+        try:
+            with CursorFromConnectionPool() as cursor:
+                execute_values(
+                    cursor,
+                    '''
+                    INSERT INTO games (id, name, avg_rating, min_players, max_players, image_path, is_expansion, yearpublished)
+                    VALUES %s
+                    ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name, avg_rating = EXCLUDED.avg_rating,
+                        min_players = EXCLUDED.min_players, max_players = EXCLUDED.max_players,
+                        image_path = EXCLUDED.image_path, is_expansion = EXCLUDED.is_expansion,
+                        yearpublished = EXCLUDED.yearpublished
+                    ''',
+                    [(game.id, game.name, game.avg_rating, game.min_players, game.max_players,
+                      game.image_path, game.is_expansion, game.yearpublished) for game in games],
+                    page_size=100
+                )
+        finally:
+            # Drop the cached rows only after the write has been committed
+            for game in games:
+                _game_cache.pop(int(game.id))
+            _search_cache.clear()
+
+    @classmethod
+    def load_by_id(cls, game_id, cursor=None):
         """Find a game by its database ID.
         
+        Rows are cached in memory for a short time and dropped whenever the
+        game is saved, so repeated lookups while navigating skip the database.
+        A call with the caller's cursor always reads from the database so it
+        sees the same transaction as the caller's other queries.
+        
         Args:
             game_id: The database ID to search for
+            cursor: Cursor of the caller's open transaction (optional,
+                defaults to a new pooled cursor)
             
         Returns:
             A Game object if found, None otherwise
         """
-        with CursorFromConnectionPool() as cursor:
-            cursor.execute('SELECT name, avg_rating, min_players, max_players, image_path, is_expansion, yearpublished FROM games WHERE id = %s',
-                           (game_id,))
-            game_data = cursor.fetchone()
-            if game_data:
-                name, avg_rating, min_players, max_players, image_path, is_expansion, yearpublished = game_data
-                return cls(name, avg_rating, min_players, max_players, image_path, game_id, is_expansion, yearpublished)
-            return None
+        game_id = int(game_id)
+        game_data = _game_cache.get(game_id) if cursor is None else None
+        if game_data is None:
+            with optional_cursor(cursor) as active_cursor:
+                Database.execute_prepared(active_cursor, 'game_load_by_id', (game_id,))
+                game_data = active_cursor.fetchone()
+            if game_data is None:
+                return None
+            if cursor is None:
+                _game_cache.set(game_id, game_data)
+        return cls(*game_data)
 
     @classmethod
     def search_by_name(cls, search_query):
@@ -138,51 +328,38 @@ class Game:
             
         Returns:
             A dictionary with three lists: local_games, local_expansions, bgg_games
+            
+        Note:
+            Result rows are cached for 45 seconds per (case-insensitive) query
+            and the cache is cleared whenever a game is saved. Every call
+            builds new Game objects, so callers may modify them freely.
         """
-        games = []
-        expansions = []
-        
         # Check if search_query is a game ID (numeric)
         is_id_search = search_query.isdigit()
         
-        with CursorFromConnectionPool() as cursor:
-            if is_id_search:
-                # Search by ID (exact match)
-                cursor.execute(
-                    'SELECT id, name, avg_rating, min_players, max_players, image_path, is_expansion, yearpublished FROM games WHERE id = %s',
-                    (search_query,))
-            else:
-                # Sort results by relevance (exact match first, then startswith, then contains)
-                cursor.execute(
-                    '''
-                    SELECT id, name, avg_rating, min_players, max_players, image_path, is_expansion, yearpublished,
-                           CASE 
-                               WHEN LOWER(name) = LOWER(%s) THEN 1 
-                               WHEN LOWER(name) LIKE LOWER(%s) THEN 2 
-                               ELSE 3 
-                           END AS match_rank 
-                    FROM games 
-                    WHERE name ILIKE %s
-                    ORDER BY match_rank, avg_rating DESC NULLS LAST, name
-                    ''',
-                    (search_query, f'{search_query}%', f'%{search_query}%'))
-                
-            for game_data in cursor.fetchall():
-                # Handle ID search (8 columns) vs name search (9 columns with match_rank)
-                if is_id_search or len(game_data) == 8:
-                    game_id, name, avg_rating, min_players, max_players, image_path, is_expansion, yearpublished = game_data
+        # Repeated searches within the cache TTL skip the ranked query entirely
+        cache_key = (search_query.lower(), is_id_search)
+        rows = _search_cache.get(cache_key)
+        if rows is None:
+            with CursorFromConnectionPool() as cursor:
+                if is_id_search:
+                    # Search by ID (exact match), same statement as load_by_id
+                    Database.execute_prepared(cursor, 'game_load_by_id', (int(search_query),))
                 else:
-                    # Skip the match_rank column for name searches
-                    game_id, name, avg_rating, min_players, max_players, image_path, is_expansion, yearpublished, _ = game_data
-                
-                game = cls(name, avg_rating, min_players, max_players, image_path, game_id, is_expansion, yearpublished)
-                game._source = "Local Database"
-                
-                # Separate games and expansions
-                if is_expansion == 1:
-                    expansions.append(game)
-                else:
-                    games.append(game)
+                    Database.execute_prepared(
+                        cursor, 'game_search_by_name',
+                        (search_query, f'{search_query}%', f'%{search_query}%', cls.SEARCH_RESULT_LIMIT))
+                rows = tuple(cursor)
+            _search_cache.set(cache_key, rows)
+        
+        # Rows arrive with base games before expansions, so one binary search finds the split
+        split = bisect.bisect_left(rows, True, key=lambda game_data: bool(game_data[6]))
+        
+        # Both queries select columns in constructor order, so rows map straight onto Game
+        games = [cls(*game_data) for game_data in rows[:split]]
+        expansions = [cls(*game_data) for game_data in rows[split:]]
+        for game in games + expansions:
+            game._source = "Local Database"
         
         # We no longer search BGG API here as it's done separately before this call
         # This prevents duplicate API calls and ensures local DB is updated first
@@ -216,24 +393,8 @@ class Game:
                     game_name = game_details.name
                     print(f"Triggering background name search for '{game_name}' after ID lookup")
                     
-                    # Use a separate thread to avoid blocking the current response
-                    import threading
-                    def background_name_search():
-                        try:
-                            # Small delay to ensure the current ID result is returned first
-                            import time
-                            time.sleep(1)
-                            
-                            # Search BGG by name to find all variants/editions
-                            print(f"Background: Searching BGG by name '{game_name}'")
-                            name_results = cls._search_bgg_by_name(game_name, cancellation_checker)
-                            print(f"Background: Found {len(name_results)} additional games by name '{game_name}'")
-                        except Exception as err:
-                            print(f"Background name search error after ID lookup: {err}")
-                    
-                    # Start the background name search
-                    thread = threading.Thread(target=background_name_search, daemon=True)
-                    thread.start()
+                    # Queue it for the single background worker instead of blocking the current response
+                    cls._queue_name_search(game_name, cancellation_checker)
                     
                     return [game_details]
                 else:
@@ -246,6 +407,71 @@ class Game:
         # For name searches, use the search API
         return cls._search_bgg_by_name(name_query, cancellation_checker, immediate_callback)
     
+    @classmethod
+    def _queue_name_search(cls, game_name, cancellation_checker=None):
+        """Queue a background BGG name search, starting the worker on first use.
+        
+        Args:
+            game_name: The name to search BGG for
+            cancellation_checker: Optional function that returns True if the search should be cancelled
+        """
+        global _name_search_worker
+        with _name_search_lock:
+            if game_name in _queued_name_searches:
+                print(f"Background name search for '{game_name}' already queued")
+                return
+            _queued_name_searches.add(game_name)
+            
+            if _name_search_worker is None:
+                _name_search_worker = threading.Thread(
+                    target=cls._run_name_searches, name="bgg-name-search", daemon=True)
+                _name_search_worker.start()
+        
+        _name_search_queue.put((game_name, cancellation_checker))
+    
+    @classmethod
+    def _run_name_searches(cls):
+        """Background worker: run queued BGG name searches one after another."""
+        while True:
+            game_name, cancellation_checker = _name_search_queue.get()
+            try:
+                # Search BGG by name to find all variants/editions
+                print(f"Background: Searching BGG by name '{game_name}'")
+                name_results = cls._search_bgg_by_name(game_name, cancellation_checker)
+                print(f"Background: Found {len(name_results)} additional games by name '{game_name}'")
+            except Exception as err:
+                print(f"Background name search error after ID lookup: {err}")
+            finally:
+                with _name_search_lock:
+                    _queued_name_searches.discard(game_name)
+    
+    @classmethod
+    def _fetch_bgg_xml(cls, url):
+        """Fetch a BGG XML API document.
+        
+        All BGG calls go through this helper. The body is parsed while it
+        streams in over the shared keep-alive session, and the response is
+        always closed so its connection returns to the pool.
+        
+        Args:
+            url: The BGG XML API URL (see BGG_SEARCH_URL and BGG_THING_URL)
+            
+        Returns:
+            The root XML element, or None if BGG did not answer with 200 OK
+            
+        Raises:
+            requests.RequestException: On network failure (after retries)
+                or if BGG does not respond within REQUEST_TIMEOUT
+            SyntaxError: If the body is not valid XML (lxml's XMLSyntaxError
+                and ElementTree's ParseError both derive from it)
+        """
+        with http_session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            if response.status_code != 200:
+                return None
+            
+            response.raw.decode_content = True
+            return Et.parse(response.raw, _xml_parser()).getroot()
+    
     @classmethod
     def _search_bgg_by_name(cls, name_query, cancellation_checker=None, immediate_callback=None):
         """Search BGG by name (extracted for reuse in ID searches).
@@ -258,14 +484,13 @@ class Game:
         Returns:
             A list of Game objects with detailed data from BoardGameGeek
         """
-        url = f"https://boardgamegeek.com/xmlapi2/search?query={name_query}&type=boardgame"
+        # Names may contain spaces, '&', '#' and other characters that must be escaped
+        url = cls.BGG_SEARCH_URL.format(query=quote_plus(name_query))
         try:
-            response = requests.get(url)
-            
-            if response.status_code != 200:
+            root = cls._fetch_bgg_xml(url)
+            if root is None:
                 return []
-                
-            root = Et.fromstring(response.content)
+            
             search_items = root.findall('.//item')
             
             print(f"BGG search found {len(search_items)} results for '{name_query}'")
@@ -282,21 +507,12 @@ class Game:
                     print(f"Providing {len(basic_games)} immediate basic results")
                     immediate_callback(basic_games)
             
-            # Now get detailed information for each game
-            games = []
-            for item in search_items:
-                # Check for cancellation before processing each game
-                if cancellation_checker and cancellation_checker():
-                    print(f"⏹️ BGG search cancelled during processing")
-                    return games  # Return partial results
-                    
-                bgg_id = item.get("id")
-                print(f"Processing BGG game ID {bgg_id}...")
-                game_details = cls.get_bgg_game_details(bgg_id)
-                if game_details:
-                    # Add source attribute for UI display
-                    game_details._source = "BoardGameGeek"
-                    games.append(game_details)
+            # Now get detailed information for all games concurrently
+            # (cancellation is checked as each fetch completes; partial results are kept)
+            games = cls.get_bgg_games_details([item.get("id") for item in search_items], cancellation_checker)
+            for game_details in games:
+                # Add source attribute for UI display
+                game_details._source = "BoardGameGeek"
             
             print(f"Successfully processed {len(games)} games from BGG")
             return games
@@ -327,23 +543,27 @@ class Game:
                 return existing_game
             
             # Game not in database - create from BGG search data
-            # Get name - prefer primary name
-            name_element = search_item.find(".//name[@type='primary']")
-            if name_element is None:
-                name_element = search_item.find(".//name")
-            if name_element is None:
-                return None
-                
-            name = name_element.get("value")
-            
-            # Get year published if available
-            yearpublished_element = search_item.find(".//yearpublished")
+            # Get name (prefer the primary name) and year in one pass over the item
+            name = None
+            fallback_name = None
             yearpublished = None
-            if yearpublished_element is not None:
-                try:
-                    yearpublished = int(yearpublished_element.get("value"))
-                except (ValueError, TypeError):
-                    pass
+            for element in search_item:
+                tag = element.tag
+                if tag == "name":
+                    if element.get("type") == "primary":
+                        name = element.get("value")
+                    elif fallback_name is None:
+                        fallback_name = element.get("value")
+                elif tag == "yearpublished":
+                    try:
+                        yearpublished = int(element.get("value"))
+                    except (ValueError, TypeError):
+                        pass
+            
+            if name is None:
+                name = fallback_name
+            if name is None:
+                return None
             
             # Create game object with available search data
             # Don't use placeholder values - use None/0 for missing data
@@ -381,135 +601,297 @@ class Game:
         """
         try:
             # First get the base game details to find linked expansions
-            url = f"https://boardgamegeek.com/xmlapi2/thing?id={base_game_id}&stats=1"
-            response = requests.get(url)
-            
-            if response.status_code != 200:
+            url = cls.BGG_THING_URL.format(ids=base_game_id)
+            root = cls._fetch_bgg_xml(url)
+            if root is None:
                 return []
-                
-            root = Et.fromstring(response.content)
+            
             item = root.find(".//item")
             
             if item is None:
                 return []
             
-            expansions = []
-            
             # Look for expansion links in the BGG data
-            for link in item.findall(".//link"):
-                if link.get("type") == "boardgameexpansion":
-                    # Check for cancellation before processing each expansion
-                    if cancellation_checker and cancellation_checker():
-                        print(f"⏹️ BGG expansion fetch cancelled during processing")
-                        return expansions  # Return partial results
-                        
-                    expansion_id = link.get("id")
-                    
-                    # Get detailed information about this expansion
-                    expansion_game = cls.get_bgg_game_details(expansion_id)
-                    if expansion_game:
-                        expansions.append(expansion_game)
+            expansion_ids = [link.get("id") for link in item.findall(".//link")
+                             if link.get("type") == "boardgameexpansion"]
             
-            return expansions
+            # Fetch the expansion details concurrently instead of one round-trip at a time
+            return cls.get_bgg_games_details(expansion_ids, cancellation_checker)
             
         except Exception as e:
             print(f"Error getting BGG expansions: {e}")
             return []
     
     @classmethod
-    def get_bgg_game_details(cls, bgg_id):
-        """Get detailed information about a game from BoardGameGeek.
+    def get_bgg_games_details(cls, bgg_ids, cancellation_checker=None):
+        """Get detailed information about several games from BoardGameGeek.
+        
+        Games fetched from BGG in the last 10 minutes are served from memory,
+        and IDs that another thread is fetching right now are awaited rather
+        than requested twice. BGG's thing endpoint accepts a comma-separated list of IDs, so the
+        remaining IDs are requested in batches of BGG_BATCH_SIZE (one HTTP round-trip
+        and one XML parse per batch). Batches run on a thread pool of at most
+        BGG_MAX_WORKERS threads. Every game is saved to the database; its
+        image is downloaded and stored in the background (see wait_for_images).
         
         Args:
-            bgg_id: The BoardGameGeek ID of the game
+            bgg_ids: The BoardGameGeek IDs of the games
+            cancellation_checker: Optional function that returns True if task should be cancelled
             
         Returns:
-            A Game object with data from BoardGameGeek, or None if not found
+            A list of Game objects in the order of bgg_ids; IDs that could not
+            be fetched are left out. On cancellation, only the games fetched
+            so far are returned (without storing their images) and
+            batches not yet started are dropped.
         """
-        """Get detailed game information from BGG API and save to database"""
-        url = f"https://boardgamegeek.com/xmlapi2/thing?id={bgg_id}&stats=1"
+        bgg_ids = [int(bgg_id) for bgg_id in dict.fromkeys(bgg_ids)]
+        if not bgg_ids:
+            return []
+        
+        # Games fetched within the last BGG cache TTL need no request at all
+        cached = {}
+        for bgg_id in bgg_ids:
+            game_data = _bgg_details_cache.get(bgg_id)
+            if game_data is not None:
+                cached[bgg_id] = cls(*game_data)
+        missing_ids = [bgg_id for bgg_id in bgg_ids if bgg_id not in cached]
+        if not missing_ids:
+            return [cached[bgg_id] for bgg_id in bgg_ids]
+        
+        # IDs another thread is already fetching are awaited instead of requested again
+        owned_ids = []
+        waiting = {}
+        with _inflight_lock:
+            for bgg_id in missing_ids:
+                inflight = _inflight_bgg_fetches.get(bgg_id)
+                if inflight is None:
+                    _inflight_bgg_fetches[bgg_id] = Future()
+                    owned_ids.append(bgg_id)
+                else:
+                    waiting[bgg_id] = inflight
+        
+        results = {}
+        cancelled = False
         try:
-            response = requests.get(url)
-            
-            if response.status_code != 200:
-                return None
-                
-            root = Et.fromstring(response.content)
-            item = root.find(".//item")
+            if owned_ids:
+                cancelled = cls._fetch_bgg_batches(owned_ids, results, cancellation_checker)
+        finally:
+            # Hand the outcome to any waiting callers (None if not fetched) and
+            # leave the in-flight map, even if fetching raised
+            with _inflight_lock:
+                for bgg_id in owned_ids:
+                    game = results.get(bgg_id)
+                    _inflight_bgg_fetches.pop(bgg_id).set_result(
+                        None if game is None else cls._bgg_details_row(game))
+        
+        fetched = list(results.values())
+        if fetched and not cancelled:
+            cls._prefetch_has_image(fetched)
+            # Images are stored in the background; a cache hit within the TTL
+            # finds the image stored or still queued, so it never needs one
+            for game in fetched:
+                _pending_images.add(_image_pool.submit(cls._store_bgg_image, game))
+                _bgg_details_cache.set(game.id, cls._bgg_details_row(game))
+        
+        if not cancelled:
+            for bgg_id, inflight in waiting.items():
+                game_data = inflight.result()
+                if game_data is not None:
+                    results[bgg_id] = cls(*game_data)
+        
+        results.update(cached)
+        return [results[bgg_id] for bgg_id in bgg_ids if bgg_id in results]
+    
+    @classmethod
+    def _fetch_bgg_batches(cls, bgg_ids, results, cancellation_checker=None):
+        """Fetch games from BGG in concurrent batches of BGG_BATCH_SIZE IDs.
+        
+        Args:
+            bgg_ids: The BoardGameGeek IDs (ints) to fetch
+            results: Dict that receives the fetched Game objects keyed by BGG ID
+            cancellation_checker: Optional function that returns True if task should be cancelled
             
-            if item is None:
-                return None
-                
-            name_element = item.find(".//name[@type='primary']")
-            if name_element is None:
-                return None
+        Returns:
+            bool: True if the fetch was cancelled before all batches finished
+        """
+        batches = [bgg_ids[start:start + cls.BGG_BATCH_SIZE]
+                   for start in range(0, len(bgg_ids), cls.BGG_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=min(cls.BGG_MAX_WORKERS, len(batches))) as executor:
+            futures = [executor.submit(cls._fetch_bgg_games, batch) for batch in batches]
+            for future in as_completed(futures):
+                if cancellation_checker and cancellation_checker():
+                    print(f"⏹️ BGG detail fetch cancelled during processing")
+                    for pending in futures:
+                        pending.cancel()
+                    return True
                 
-            name = name_element.get("value")
+                try:
+                    results.update(future.result())
+                except Exception as e:
+                    print(f"Error getting BGG game details: {e}")
+        return False
+    
+    @staticmethod
+    def _bgg_details_row(game):
+        """Get a game's fields as a constructor-ordered tuple for sharing between threads.
+        
+        Args:
+            game: Game object fetched from BGG
             
-            # Get rating
-            rating_element = item.find(".//statistics/ratings/average")
-            avg_rating = float(rating_element.get("value")) if rating_element is not None else 0.0
-            # Round to 1 decimal place for display
-            avg_rating = round(avg_rating, 1)
+        Returns:
+            tuple: Arguments that rebuild the game with Game(*row)
+        """
+        return (game.name, game.avg_rating, game.min_players, game.max_players, game.image_path,
+                game.id, game.is_expansion, game.yearpublished)
+    
+    @classmethod
+    def wait_for_images(cls, timeout=None):
+        """Wait until the queued background image downloads have finished.
+        
+        Args:
+            timeout: Maximum number of seconds to wait. Defaults to None (no limit).
             
-            # Get player counts
-            min_players_element = item.find(".//minplayers")
-            min_players = int(min_players_element.get("value")) if min_players_element is not None else 1
+        Returns:
+            bool: True if every queued download has finished
+        """
+        return not wait(list(_pending_images), timeout=timeout).not_done
+    
+    @classmethod
+    def clear_bgg_cache(cls):
+        """Forget all games fetched from BGG, so the next lookups hit the API again."""
+        _bgg_details_cache.clear()
+    
+    @classmethod
+    def get_bgg_game_details(cls, bgg_id):
+        """Get detailed information about a game from BoardGameGeek.
+        
+        Single-ID form of get_bgg_games_details().
+        
+        Args:
+            bgg_id: The BoardGameGeek ID of the game
             
-            max_players_element = item.find(".//maxplayers")
-            max_players = int(max_players_element.get("value")) if max_players_element is not None else 1
+        Returns:
+            A Game object with data from BoardGameGeek, or None if not found
+        """
+        games = cls.get_bgg_games_details([bgg_id])
+        return games[0] if games else None
+    
+    @classmethod
+    def _fetch_bgg_games(cls, bgg_ids):
+        """Fetch one batch of games from the BGG thing endpoint and save them.
+        
+        The whole batch is saved with one save_many() statement.
+        
+        Args:
+            bgg_ids: Up to BGG_BATCH_SIZE BoardGameGeek IDs (ints)
             
+        Returns:
+            dict: Game objects keyed by BGG ID; IDs BGG did not return are missing
             
-            # Get image
-            image_element = item.find(".//image")
-            image_path = image_element.text if image_element is not None else ""
+        Raises:
+            requests.RequestException: On network failure (after retries)
+        """
+        root = cls._fetch_bgg_xml(cls.BGG_THING_URL.format(ids=",".join(map(str, bgg_ids))))
+        if root is None:
+            return {}
+        
+        games = {}
+        for item in root.iter("item"):
+            game = cls._create_game_from_bgg_item(item)
+            if game:
+                games[game.id] = game
+        
+        cls.save_many(list(games.values()))
+        return games
+    
+    @classmethod
+    def _create_game_from_bgg_item(cls, item):
+        """Create a Game from a BGG thing <item> element (not yet saved).
+        
+        Args:
+            item: XML <item> element from the BGG thing endpoint
             
-            # Check if game is an expansion
+        Returns:
+            The Game object, or None if the item has no primary name or
+            could not be parsed
+        """
+        try:
+            # Collect every field in one pass over the item's children instead
+            # of re-walking the subtree with a find() per field
+            name = None
+            avg_rating = 0.0
+            min_players = max_players = 1
+            image_path = ""
             is_expansion = 0
-            for link in item.findall(".//link"):
-                if link.get("type") == "boardgamecategory" and link.get("value") == "Expansion for Base-game":
-                    is_expansion = 1
-                    break
-                    
-            # Get year published
             yearpublished = None
-            yearpublished_element = item.find(".//yearpublished")
-            if yearpublished_element is not None:
-                try:
-                    yearpublished = int(yearpublished_element.get("value"))
-                except (ValueError, TypeError):
-                    pass
+            for element in item:
+                tag = element.tag
+                if tag == "name":
+                    if element.get("type") == "primary":
+                        name = element.get("value")
+                elif tag == "link":
+                    # Check if game is an expansion
+                    if element.get("type") == "boardgamecategory" and element.get("value") == "Expansion for Base-game":
+                        is_expansion = 1
+                elif tag == "minplayers":
+                    min_players = int(element.get("value"))
+                elif tag == "maxplayers":
+                    max_players = int(element.get("value"))
+                elif tag == "image":
+                    image_path = element.text
+                elif tag == "yearpublished":
+                    try:
+                        yearpublished = int(element.get("value"))
+                    except (ValueError, TypeError):
+                        pass
+                elif tag == "statistics":
+                    # Rating lives at statistics/ratings/average
+                    for ratings in element:
+                        if ratings.tag == "ratings":
+                            for rating in ratings:
+                                if rating.tag == "average":
+                                    # Round to 1 decimal place for display
+                                    avg_rating = round(float(rating.get("value")), 1)
+            
+            if name is None:
+                return None
                 
             # Create game with BGG ID as the game ID
-            game = cls(name, avg_rating, min_players, max_players, image_path, game_id=int(bgg_id),
+            game = cls(name, avg_rating, min_players, max_players, image_path, game_id=int(item.get("id")),
                        is_expansion=is_expansion, yearpublished=yearpublished)
-            game.save_to_db()
-            
-            # Immediately download and store image locally if available
-            if game.image_path and game.image_path != 'N/A':
-                print(f"Downloading image for {game.name}...")
-                success = game.download_and_store_image()
-                if success:
-                    print(f"✅ Image stored for {game.name}")
-                else:
-                    print(f"❌ Failed to store image for {game.name}")
-            
             return game
         except Exception as e:
             print(f"Error getting BGG game details: {e}")
             return None
+    
+    @staticmethod
+    def _store_bgg_image(game):
+        """Download and store a freshly fetched game's image locally, if it has one.
+        
+        Args:
+            game: Game object created from BGG data
+        """
+        if game.image_path and game.image_path != 'N/A':
+            print(f"Downloading image for {game.name}...")
+            success = game.download_and_store_image()
+            if success:
+                print(f"✅ Image stored for {game.name}")
+            else:
+                print(f"❌ Failed to store image for {game.name}")
 
-    def get_flashcards(self, current_user_id=None):
+    def get_flashcards(self, current_user_id=None, cursor=None):
         """Get all flashcards for this game.
         
         Args:
             current_user_id: The ID of the current user (to show their private cards)
+            cursor: Cursor of the caller's open transaction (optional,
+                defaults to a new pooled cursor)
         
         Returns:
             A list of Flashcard objects for this game (filtered by privacy)
         """
         from models.flashcard import Flashcard
-        return Flashcard.get_by_game_id(self.id, current_user_id)
+        return Flashcard.get_by_game_id(self.id, current_user_id, cursor=cursor)
     
     def get_image_src(self):
         """Get the image source for display in UI.
@@ -519,28 +901,43 @@ class Game:
         Returns:
             Dict containing either 'src' (URL) or 'src_base64' (base64 data)
         """
-        if self.id:
-            # Try to get local image first
-            base64_image = ImageService.get_image_as_base64(self.id)
-            if base64_image:
-                # Extract just the base64 part (remove data:image/jpeg;base64, prefix)
-                if base64_image.startswith('data:'):
-                    base64_data = base64_image.split(',', 1)[1]
-                    return {'src_base64': base64_data}
+        # Try to get local image first (unless the row already says there is none)
+        if self.id and self._has_image is not False:
+            base64_data = self._get_image_base64(self.id)
+            if base64_data:
+                return {'src_base64': base64_data}
         
         # If we have an external URL, use it
         if self.image_path and self.image_path != 'N/A' and self.image_path.strip():
             return {'src': self.image_path}
         
         # Fall back to local placeholder image (stored with ID -1)
-        placeholder_image = ImageService.get_image_as_base64(-1)
-        if placeholder_image and placeholder_image.startswith('data:'):
-            base64_data = placeholder_image.split(',', 1)[1]
+        base64_data = self._get_image_base64(-1, ttl=PLACEHOLDER_IMAGE_TTL)
+        if base64_data:
             return {'src_base64': base64_data}
         
         # Final fallback to remote URL if local placeholder fails
         return {'src': 'https://cf.geekdo-images.com/zxVVmggfpHJpmnJY9j-k1w__imagepage/img/6AJ0hDAeJlICZkzaeIhZA_fSiAI=/fit-in/900x600/filters:no_upscale():strip_icc()/pic1657689.jpg'}
     
+    @staticmethod
+    def _get_image_base64(game_id, ttl=None):
+        """Get a stored image as plain base64 data, cached in memory.
+        
+        Args:
+            game_id: The game ID (-1 for the placeholder image)
+            ttl: Cache lifetime in seconds. Defaults to the cache-wide TTL.
+            
+        Returns:
+            The base64 data without the data URI prefix, or None if no image is stored
+        """
+        base64_data = _image_base64_cache.get(game_id)
+        if base64_data is None:
+            base64_data = ImageService.get_image_base64_raw(game_id)
+            if not base64_data:
+                return None
+            _image_base64_cache.set(game_id, base64_data, ttl=ttl)
+        return base64_data
+    
     def download_and_store_image(self, force_update=False):
         """Download and store the image locally in the database.
         
@@ -558,17 +955,45 @@ class Game:
             print(f"Image already exists for {self.name}, skipping download")
             return True
         
-        return ImageService.download_and_store_image(self.id, self.image_path)
+        stored = ImageService.download_and_store_image(self.id, self.image_path)
+        if stored:
+            # Cached rows still carry the old has_image flag
+            self._has_image = True
+            _game_cache.pop(int(self.id))
+            _image_base64_cache.pop(int(self.id))
+            _search_cache.clear()
+        return stored
 
     def _has_local_image(self):
         """Check if this game already has a locally stored image.
         
+        Uses the flag loaded with the game row (or by _prefetch_has_image)
+        and only queries the database when it is unknown.
+        
         Returns:
             True if local image exists, False otherwise
         """
+        if self._has_image is not None:
+            return self._has_image
+        
         with CursorFromConnectionPool() as cursor:
             cursor.execute(
                 'SELECT image_oid FROM games WHERE id = %s AND image_oid IS NOT NULL',
                 (self.id,)
             )
-            return cursor.fetchone() is not None
\ No newline at end of file
+            self._has_image = cursor.fetchone() is not None
+            return self._has_image
+
+    @classmethod
+    def _prefetch_has_image(cls, games):
+        """Load the local-image flag of several games with one query.
+        
+        Args:
+            games: Game objects with id set
+        """
+        with CursorFromConnectionPool() as cursor:
+            cursor.execute('SELECT id FROM games WHERE id = ANY(%s) AND image_oid IS NOT NULL',
+                           ([game.id for game in games],))
+            with_image = {game_id for game_id, in cursor}
+        for game in games:
+            game._has_image = game.id in with_image
\ No newline at end of file
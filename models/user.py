@@ -10,13 +10,55 @@ The User class provides functionality for:
 - Database CRUD operations for user data
 
 Security Note:
-    The current implementation uses SHA-256 for password hashing.
-    For production use, consider upgrading to bcrypt or similar
-    password hashing libraries for enhanced security.
+    Passwords are hashed with bcrypt through the native ``bcrypt`` bindings.
+    Accounts created before the switch still carry unsalted SHA-256 hashes;
+    these are verified with the legacy algorithm so existing users can log in,
+    and replaced with a bcrypt hash on that successful login.
+
+Configuration:
+    BCRYPT_ROUNDS - bcrypt cost factor (default: 12). Each increment doubles
+        the hashing time; aim for roughly 250 ms per hash on the target host.
+        The value is read once when this module is imported.
 """
 
 import hashlib
-from database import CursorFromConnectionPool
+import hmac
+import os
+import time
+import bcrypt
+from database import CursorFromConnectionPool, Database
+from utils.ttl_cache import TTLCache
+
+# bcrypt cost factor, read once at import so every hash uses the same setting
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Recently loaded user rows keyed by user ID (pages reload the user on every navigation)
+_user_cache = TTLCache(maxsize=5000, ttl=30)
+
+# Saved-game rows per user ID; the main page reloads the collection on every visit
+_saved_games_cache = TTLCache(maxsize=1024, ttl=30)
+
+Database.register_prepared_statement(
+    'user_load_by_username',
+    'SELECT id, username, email, password_hash FROM users WHERE username = $1'
+)
+Database.register_prepared_statement(
+    'user_load_by_id',
+    'SELECT id, username, email, password_hash FROM users WHERE id = $1'
+)
+Database.register_prepared_statement(
+    'user_update_password_hash',
+    'UPDATE users SET password_hash = $1 WHERE id = $2 AND password_hash = $3'
+)
+Database.register_prepared_statement(
+    'user_saved_games',
+    """
+    SELECT g.name, g.avg_rating, g.min_players, g.max_players, g.image_path, g.id
+    FROM games g
+    JOIN user_saved_games usg ON g.id = usg.game_id
+    WHERE usg.user_id = $1
+    """
+)
 
 
 class User:
@@ -34,14 +76,20 @@ class User:
         password_hash (str): Hashed password stored in database
         
     Security:
-        - Passwords are hashed using SHA-256 before storage
+        - Passwords are hashed using bcrypt (salted) before storage
         - Plain text passwords are never stored in the database
-        - Password verification is done by comparing hashes
+        - Password verification is done by bcrypt.checkpw
         
     Database Relations:
         - One-to-many with flashcards (user can create multiple flashcards)
         - Many-to-many with games through user_saved_games table
+        
+    Note:
+        The class declares __slots__, so instances carry no per-object
+        __dict__ and attribute access goes through slot descriptors.
     """
+    __slots__ = ('id', 'username', 'email', 'password', 'password_hash')
+
     def __init__(self, username, email, password, id=None):
         """Initialize a new User instance.
         
@@ -74,7 +122,7 @@ class User:
             DatabaseError: If database operation fails or username already exists
             
         Security:
-            The plain text password is hashed using SHA-256 before storage.
+            The plain text password is hashed using bcrypt before storage.
             The original password is not stored in the database.
         """
         with CursorFromConnectionPool() as cursor:
@@ -101,7 +149,7 @@ class User:
             but will contain the password_hash for verification purposes.
         """
         with CursorFromConnectionPool() as cursor:
-            cursor.execute('SELECT id, username, email, password_hash FROM users WHERE username = %s', (username,))
+            Database.execute_prepared(cursor, 'user_load_by_username', (username,))
             user_data = cursor.fetchone()
             if user_data:
                 id, username, email, password_hash = user_data
@@ -114,6 +162,9 @@ class User:
     def load_by_id(cls, user_id):
         """Load a user from the database by ID.
         
+        Rows are cached in memory for a short time, so repeated lookups of
+        the same user (one per page navigation) skip the database round-trip.
+        
         Args:
             user_id (int): The database ID to search for
             
@@ -124,52 +175,103 @@ class User:
             The returned User object will have an empty password field
             but will contain the password_hash for verification purposes.
         """
-        with CursorFromConnectionPool() as cursor:
-            cursor.execute('SELECT id, username, email, password_hash FROM users WHERE id = %s', (user_id,))
-            user_data = cursor.fetchone()
-            if user_data:
-                id, username, email, password_hash = user_data
-                user = cls(username, email, '', id)
-                user.password_hash = password_hash
-                return user
-            return None
+        user_data = _user_cache.get(user_id)
+        if user_data is None:
+            with CursorFromConnectionPool() as cursor:
+                Database.execute_prepared(cursor, 'user_load_by_id', (user_id,))
+                user_data = cursor.fetchone()
+            if user_data is None:
+                return None
+            _user_cache.set(user_id, user_data)
+
+        id, username, email, password_hash = user_data
+        user = cls(username, email, '', id)
+        user.password_hash = password_hash
+        return user
 
     def verify_password(self, password_to_check):
         """Verify if a password matches this user's stored password.
         
-        Hashes the provided password and compares it with the stored
-        password hash for secure authentication.
+        Checks the provided password against the stored bcrypt hash. Hashes
+        written before the bcrypt migration (64-character SHA-256 hex digests)
+        are still verified with the legacy algorithm; on a match the stored
+        hash is upgraded to bcrypt.
         
         Args:
             password_to_check (str): The password to verify
             
         Returns:
             bool: True if the password matches, False otherwise
-            
-        Security:
-            Uses the same SHA-256 hashing algorithm used during registration
-            to ensure consistent password verification.
         """
-        return self._hash_password(password_to_check) == self.password_hash
+        if not self.password_hash:
+            return False
+
+        if self._is_legacy_hash(self.password_hash):
+            legacy_hash = hashlib.sha256(password_to_check.encode()).hexdigest()
+            if not hmac.compare_digest(legacy_hash, self.password_hash):
+                return False
+            self._upgrade_legacy_hash(password_to_check)
+            return True
+
+        return bcrypt.checkpw(password_to_check.encode(), self.password_hash.encode())
+
+    def _upgrade_legacy_hash(self, password):
+        """Replace this user's legacy SHA-256 hash with a bcrypt hash.
+        
+        Called after the plain text password was verified against the legacy
+        hash, the only time it is available. The UPDATE only matches while
+        the legacy hash is still stored, so a password changed in the
+        meantime is not overwritten.
+        
+        Args:
+            password (str): The verified plain text password
+        """
+        legacy_hash = self.password_hash
+        password_hash = self._hash_password(password)
+        with CursorFromConnectionPool() as cursor:
+            Database.execute_prepared(cursor, 'user_update_password_hash',
+                                      (password_hash, self.id, legacy_hash))
+            if cursor.rowcount == 1:
+                self.password_hash = password_hash
+        _user_cache.pop(self.id)
 
     @staticmethod
     def _hash_password(password):
-        """Hash a password using SHA-256.
+        """Hash a password using bcrypt.
         
         Args:
             password (str): The password to hash
             
         Returns:
-            str: The hashed password as a hexadecimal string
+            str: The bcrypt hash (salt and cost factor included)
+        """
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+    @staticmethod
+    def measure_hash_time():
+        """Measure how long one password hash takes with the configured cost.
+        
+        Hashes a dummy password once so operators can tune BCRYPT_ROUNDS
+        for their hardware without guesswork.
+        
+        Returns:
+            float: Time taken by a single hash, in milliseconds
+        """
+        start = time.perf_counter()
+        bcrypt.hashpw(b"self-test", bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+        return (time.perf_counter() - start) * 1000
+
+    @staticmethod
+    def _is_legacy_hash(password_hash):
+        """Check whether a stored hash is a pre-bcrypt SHA-256 hex digest.
+        
+        Args:
+            password_hash (str): The stored password hash
             
-        Security Note:
-            This implementation uses SHA-256 for demonstration purposes.
-            For production applications, consider using bcrypt, scrypt, or
-            argon2 which are specifically designed for password hashing
-            and include built-in salt generation and configurable work factors.
+        Returns:
+            bool: True for legacy SHA-256 hashes, False for bcrypt hashes
         """
-        # Simple hashing for demonstration - in a real app, use a proper password hashing library like bcrypt
-        return hashlib.sha256(password.encode()).hexdigest()
+        return len(password_hash) == 64 and not password_hash.startswith('$')
 
     def get_saved_games(self):
         """Get all games in this user's personal collection.
@@ -184,41 +286,55 @@ class User:
             The returned Game objects contain basic information (name, rating,
             player counts, image) but not all detailed BGG data. Use
             Game.load_by_id() if full details are needed.
+            
+            The rows are cached per user for a short time and the cache is
+            cleared by save_game() and unsave_game(). Every call still
+            returns new Game objects, so callers may modify them freely.
         """
-        with CursorFromConnectionPool() as cursor:
-            cursor.execute('''
-                SELECT g.id, g.name, g.avg_rating, g.min_players, g.max_players, g.image_path
-                FROM games g
-                JOIN user_saved_games usg ON g.id = usg.game_id
-                WHERE usg.user_id = %s
-            ''', (self.id,))
-
-            from models.game import Game
-            games = []
-            for game_data in cursor.fetchall():
-                game_id, name, avg_rating, min_players, max_players, image_path = game_data
-                game = Game(name, avg_rating, min_players, max_players, image_path, game_id)
-                games.append(game)
-
-            return games
+        from models.game import Game
+        
+        rows = _saved_games_cache.get(self.id)
+        if rows is None:
+            with CursorFromConnectionPool() as cursor:
+                Database.execute_prepared(cursor, 'user_saved_games', (self.id,))
+                rows = tuple(cursor)
+            _saved_games_cache.set(self.id, rows)
+        
+        # Columns are selected in Game constructor order, so rows map straight onto it
+        return [Game(*game_data) for game_data in rows]
 
     def save_game(self, game_id):
         """Add a game to this user's personal collection.
         
         Creates a relationship between the user and game in the
-        user_saved_games table. Uses ON CONFLICT DO NOTHING to
-        prevent duplicate entries.
+        user_saved_games table. The existence check and the insert run as a
+        single statement, and ON CONFLICT DO NOTHING prevents duplicate entries.
         
         Args:
             game_id (int): The database ID of the game to save
             
+        Returns:
+            bool: True if the game exists (and is now in the collection),
+                False if there is no such game in the database
+            
         Note:
             If the game is already in the user's collection, this
             operation will silently succeed without creating duplicates.
         """
         with CursorFromConnectionPool() as cursor:
-            cursor.execute('INSERT INTO user_saved_games (user_id, game_id) VALUES (%s, %s) ON CONFLICT DO NOTHING',
-                           (self.id, game_id))
+            cursor.execute('''
+                WITH game AS (
+                    SELECT id FROM games WHERE id = %s
+                ), saved AS (
+                    INSERT INTO user_saved_games (user_id, game_id)
+                    SELECT %s, id FROM game
+                    ON CONFLICT DO NOTHING
+                )
+                SELECT EXISTS (SELECT 1 FROM game)
+            ''', (game_id, self.id))
+            exists = cursor.fetchone()[0]
+        _saved_games_cache.pop(self.id)
+        return exists
                            
     def unsave_game(self, game_id):
         """Remove a game from this user's personal collection.
@@ -238,4 +354,5 @@ class User:
         """
         with CursorFromConnectionPool() as cursor:
             cursor.execute('DELETE FROM user_saved_games WHERE user_id = %s AND game_id = %s',
-                           (self.id, game_id))
\ No newline at end of file
+                           (self.id, game_id))
+        _saved_games_cache.pop(self.id)
\ No newline at end of file
@@ -24,13 +24,21 @@ class AuthPage:
         self.username = None
         self.page = page
         self.on_login = on_login
+        self.control = None
 
     def build(self):
         """Create the login/register page UI.
         
+        The controls are created on the first call only. Later calls (for
+        example after a logout) clear the form and return the same Column.
+        
         Returns:
             A Column containing the login form
         """
+        if self.control is not None:
+            self.reset_fields()
+            return self.control
+
         self.username = ft.TextField(
             label="Username", 
             autofocus=True, 
@@ -57,7 +65,7 @@ class AuthPage:
 
         self.is_login_mode = True
 
-        return ft.Column(
+        self.control = ft.Column(
             [
                 ft.Text("Board Game Flashcards", size=30, weight=ft.FontWeight.BOLD),
                 self.message,
@@ -70,6 +78,24 @@ class AuthPage:
             alignment=ft.MainAxisAlignment.CENTER,
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
         )
+        return self.control
+
+    def reset_fields(self):
+        """Clear the form and switch back to login mode.
+        
+        Only the control values are changed; the caller is responsible for
+        the page update.
+        """
+        self.username.value = ""
+        self.password.value = ""
+        self.email.value = ""
+        self.message.value = ""
+        
+        if not self.is_login_mode:
+            self.is_login_mode = True
+            self.login_btn.text = "Login"
+            self.register_btn.text = "Register"
+            self.email.visible = False
 
     def toggle_auth_mode(self, _):
         """Switch between login and register modes.
@@ -76,7 +76,7 @@ class CreateFlashcardPage:
         self.game = None
         self.flashcard = None
         self.is_edit_mode = flashcard_id is not None
-        self.categories = ["Setup", "Rules", "Events", "Points", "End of the game", "Notes"]
+        self.categories = Flashcard.CATEGORIES
 
     def load_data(self):
         """Load required data based on the page mode.
@@ -140,28 +140,23 @@ class CreateFlashcardPage:
             self.flashcard.content = content
             self.flashcard.category = category
             self.flashcard.is_private = is_private
-            self.flashcard.update()
+            if not self.flashcard.update():
+                self.message.value = ("Could not update the flashcard: it no longer exists, "
+                                      "is not yours, or another of your flashcards has this title")
+                self.message.color = ft.Colors.RED
+                self.page.update()
+                return
             self.message.value = "Flashcard updated successfully"
             self.message.color = ft.Colors.GREEN
         else:
-            # Check if a flashcard with this title already exists for this game and user
-            existing_flashcard = Flashcard.find_by_game_user_title(self.game_id, self.user_id, title)
-            
-            if existing_flashcard:
-                # Append to existing flashcard with an empty line between old and new content
-                updated_content = existing_flashcard.content + "\n\n" + content
-                existing_flashcard.content = updated_content
-                existing_flashcard.category = category
-                existing_flashcard.is_private = is_private
-                existing_flashcard.update()
-                self.message.value = "Flashcard content appended successfully"
-                self.message.color = ft.Colors.GREEN
-            else:
-                # Create new flashcard
-                flashcard = Flashcard(self.game_id, self.user_id, category, title, content, is_private=is_private)
-                flashcard.save_to_db()
+            # Create the flashcard, or append to an existing one with the same title,
+            # in one atomic statement
+            flashcard = Flashcard(self.game_id, self.user_id, category, title, content, is_private=is_private)
+            if flashcard.save_or_append():
                 self.message.value = "New flashcard created successfully"
-                self.message.color = ft.Colors.GREEN
+            else:
+                self.message.value = "Flashcard content appended successfully"
+            self.message.color = ft.Colors.GREEN
         
         self.page.update()
         self.on_save()
@@ -1,9 +1,11 @@
 import flet as ft
+from database import optional_cursor
 from models.game import Game
+from models.flashcard import Flashcard
 
 
 class GameDetailPage:
-    def __init__(self, page: ft.Page, game_id, user_id, on_create_flashcard, on_edit_flashcard, on_back):
+    def __init__(self, page: ft.Page, game_id, user_id, on_create_flashcard, on_edit_flashcard, on_back, user=None, on_remove=None):
         self.flashcards_view = None
         self.page = page
         self.game_id = game_id
@@ -11,24 +13,38 @@ class GameDetailPage:
         self.on_create_flashcard = on_create_flashcard
         self.on_edit_flashcard = on_edit_flashcard
         self.on_back = on_back
+        self.on_remove = on_remove
         self.game = None
-        self.user = None
+        self.user = user
         self.flashcards = []
-        self.current_category = "Setup"
-        self.categories = ["Setup", "Rules", "Events", "Points", "End of the game", "Notes"]
+        self.flashcards_by_category = {}
+        self.categories = Flashcard.CATEGORIES
+        self.current_category = self.categories[0]
         
-        # Load user
-        from models.user import User
-        self.user = User.load_by_id(user_id)
+        # Load user, unless the caller already has the logged-in user in memory
+        if self.user is None:
+            from models.user import User
+            self.user = User.load_by_id(user_id)
 
     def load_data(self):
-        self.game = Game.load_by_id(self.game_id)
-        if not self.game:
-            return False
+        # The game and its flashcards are read on one cursor, in one transaction
+        with optional_cursor() as cursor:
+            self.game = Game.load_by_id(self.game_id, cursor=cursor)
+            if not self.game:
+                return False
 
-        self.flashcards = self.game.get_flashcards(self.user_id)
+            self.set_flashcards(self.game.get_flashcards(self.user_id, cursor=cursor))
         return True
 
+    def set_flashcards(self, flashcards):
+        # Group once per load so switching tabs does not rescan every flashcard.
+        # get_by_game_id returns rows ordered by category, created_at, so each
+        # group keeps its creation order.
+        self.flashcards = flashcards
+        self.flashcards_by_category = {}
+        for flashcard in flashcards:
+            self.flashcards_by_category.setdefault(flashcard.category, []).append(flashcard)
+
     def change_category(self, category):
         self.current_category = category
         self.update_flashcards_view()
@@ -36,8 +52,8 @@ class GameDetailPage:
     def update_flashcards_view(self):
         self.flashcards_view.controls.clear()
 
-        # Filter flashcards by current category
-        category_flashcards = [f for f in self.flashcards if f.category == self.current_category]
+        # Flashcards of the current category, grouped in set_flashcards
+        category_flashcards = self.flashcards_by_category.get(self.current_category, [])
 
         if not category_flashcards:
             self.flashcards_view.controls.append(
@@ -97,12 +113,16 @@ class GameDetailPage:
             dialog.open = False
             self.page.update()
 
-            # Delete the flashcard
-            from models.flashcard import Flashcard
-            Flashcard.delete_by_id(flashcard_id)
+            # Delete the flashcard (only succeeds for the current user's own cards)
+            if Flashcard.delete_by_id(flashcard_id, self.user_id) is None:
+                # Already gone or not ours; the local list is stale, so reload it
+                self.set_flashcards(self.game.get_flashcards(self.user_id))
+                self.update_flashcards_view()
+                self.page.open(ft.SnackBar(ft.Text("This flashcard could not be deleted; the list has been refreshed.")))
+                return
 
-            # Reload flashcards
-            self.flashcards = self.game.get_flashcards(self.user_id)
+            # The DELETE confirmed the row is gone; drop it locally instead of reloading
+            self.set_flashcards([f for f in self.flashcards if f.id != flashcard_id])
             self.update_flashcards_view()
 
         dialog = ft.AlertDialog(
@@ -134,6 +154,8 @@ class GameDetailPage:
             # Remove the game from user's saved games
             if self.user:
                 self.user.unsave_game(self.game_id)
+                if self.on_remove:
+                    self.on_remove()
                 # Navigate back to the main page
                 self.on_back()
 
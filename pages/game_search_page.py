@@ -372,8 +372,11 @@ class GameSearchPage:
         self.page.update()
 
     def save_game(self, game_id):
-        self.user.save_game(game_id)
-        self.on_save_game()
+        if self.user.save_game(game_id):
+            self.on_save_game()
+        else:
+            # Basic search results are only stored once their BGG details arrive
+            self.page.open(ft.SnackBar(ft.Text("Game details are still loading from BoardGameGeek, please try again shortly.")))
 
     def build(self):
         # Create header with back button
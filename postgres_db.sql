@@ -1,3 +1,6 @@
+-- Trigram matching for substring game name searches
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Users table
 CREATE TABLE users (
     id SERIAL PRIMARY KEY,
@@ -37,12 +40,17 @@ CREATE TABLE user_saved_games (
     PRIMARY KEY (user_id, game_id)
 );
 
+-- Flashcard categories, declared in display order. An ENUM is stored in
+-- 4 bytes and compared as an integer, and sorts in this declaration order.
+-- Existing databases: run migrations/001_flashcard_category_enum.sql.
+CREATE TYPE flashcard_category AS ENUM ('Setup', 'Rules', 'Events', 'Points', 'End of the game', 'Notes');
+
 -- Flashcards table
 CREATE TABLE flashcards (
     id SERIAL PRIMARY KEY,
     game_id INTEGER REFERENCES games(id) ON DELETE CASCADE,
     user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
-    category VARCHAR(50) NOT NULL CHECK (category IN ('Setup', 'Rules', 'Events', 'Points', 'End of the game', 'Notes')),
+    category flashcard_category NOT NULL,
     title VARCHAR(255) NOT NULL,
     content TEXT NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -54,14 +62,33 @@ CREATE TABLE flashcards (
 COMMENT ON COLUMN flashcards.is_private IS 'Whether this flashcard is private to the creator (TRUE) or visible to all users (FALSE)';
 
 -- Indexes for performance optimization
+-- Trigram index so name ILIKE '%query%' searches avoid a sequential scan
+CREATE INDEX idx_games_name_trgm ON games USING gin (name gin_trgm_ops);
+
 -- Index for games with images (sparse index)
 CREATE INDEX idx_games_has_image_oid ON games (image_oid) WHERE image_oid IS NOT NULL;
 
 -- Index for flashcard privacy filtering
 CREATE INDEX idx_flashcards_privacy ON flashcards (is_private, user_id);
 
--- Index for flashcards by game (common query pattern)
-CREATE INDEX idx_flashcards_game_id ON flashcards (game_id);
+-- Index for flashcards by game (common query pattern). Matches the
+-- ORDER BY of Flashcard.get_by_game_id (and the keyset of get_page_by_game_id)
+-- so rows come back pre-sorted without a sort node; the privacy columns are included so the OR filter is checked in
+-- the index. title/content are deliberately not included: TEXT values can
+-- exceed the btree tuple size limit and would make inserts fail.
+-- On an existing database create it with CREATE INDEX CONCURRENTLY.
+CREATE INDEX idx_flashcards_game_category ON flashcards (game_id, category, created_at, id)
+    INCLUDE (is_private, user_id);
+
+-- One title per user and game; lets Flashcard.save_or_append append to an
+-- existing card with INSERT ... ON CONFLICT instead of a lookup first.
+-- Existing databases: run migrations/002_flashcards_unique_title.sql, which
+-- merges duplicate titles before building the index.
+CREATE UNIQUE INDEX idx_flashcards_game_user_title ON flashcards (game_id, user_id, title);
+
+-- Smaller partial index for the public-only listing (no logged-in user)
+CREATE INDEX idx_flashcards_game_public ON flashcards (game_id, category, created_at, id)
+    WHERE is_private = FALSE;
 
 -- Index for user saved games lookup
 CREATE INDEX idx_user_saved_games_user_id ON user_saved_games (user_id);
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""Tests for the Flashcard model."""
+
+import csv
+import io
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from models.flashcard import Flashcard
+
+
+class CopyCursor:
+    """Stand-in cursor that hands out IDs and records the COPY payload."""
+
+    def __init__(self):
+        self.rows = []
+        self.copy_sql = None
+        self.copy_rows = None
+
+    def execute(self, query, params=None):
+        self.rows = [(flashcard_id,) for flashcard_id in range(101, 101 + params[0])]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def copy_expert(self, sql, file):
+        self.copy_sql = sql
+        self.copy_rows = list(csv.reader(io.StringIO(file.read())))
+
+
+def test_bulk_copy_keeps_empty_content_not_null():
+    cursor = CopyCursor()
+    flashcard = Flashcard(7, 3, "Notes", "Empty card", "")
+
+    ids = Flashcard.bulk_copy([flashcard], cursor=cursor)
+
+    assert ids == [101]
+    assert flashcard.id == 101
+    # The empty content goes out as an empty CSV field, which COPY would
+    # read as NULL unless the column is listed in FORCE_NOT_NULL
+    assert cursor.copy_rows == [["101", "7", "3", "Notes", "Empty card", "", "False"]]
+    assert "FORCE_NOT_NULL (title, content)" in cursor.copy_sql
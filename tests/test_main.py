@@ -0,0 +1,67 @@
+"""Tests for the navigation helpers in main.py."""
+
+import types
+
+import pytest
+
+pytest.importorskip("flet")
+pytest.importorskip("psycopg2")
+pytest.importorskip("bcrypt")
+pytest.importorskip("dotenv")
+
+import main
+
+
+class FakePage:
+    """Minimal stand-in for ft.Page recording the routes navigated to."""
+
+    def __init__(self, routes):
+        self.views = [types.SimpleNamespace(route=route) for route in routes]
+        self.visited = []
+
+    def go(self, route):
+        self.visited.append(route)
+
+
+def test_pop_view_returns_to_view_underneath():
+    page = FakePage(["/", "/game/1"])
+
+    main.pop_view(page)
+
+    assert [view.route for view in page.views] == ["/"]
+    assert page.visited == ["/"]
+
+
+def test_pop_view_on_root_view_goes_home():
+    page = FakePage(["/game/1"])
+
+    main.pop_view(page)
+
+    assert [view.route for view in page.views] == ["/game/1"]
+    assert page.visited == ["/"]
+
+
+@pytest.fixture
+def fresh_settings():
+    main.database_settings.cache_clear()
+    yield main.database_settings
+    main.database_settings.cache_clear()
+
+
+def test_malformed_pool_sizes_fall_back_to_defaults(monkeypatch, fresh_settings):
+    monkeypatch.setenv("DB_POOL_MIN", "five")
+    monkeypatch.setenv("DB_POOL_MAX", "0")
+
+    settings = fresh_settings()
+
+    assert settings["minconn"] == main.DEFAULT_POOL_MIN
+    assert settings["maxconn"] == main.DEFAULT_POOL_MAX
+
+
+def test_pool_max_is_raised_to_pool_min(monkeypatch, fresh_settings):
+    monkeypatch.setenv("DB_POOL_MIN", "10")
+    monkeypatch.setenv("DB_POOL_MAX", "4")
+
+    settings = fresh_settings()
+
+    assert (settings["minconn"], settings["maxconn"]) == (10, 10)
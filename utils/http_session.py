@@ -0,0 +1,73 @@
+"""HTTP Session Module.
+
+This module provides the shared requests.Session used for every outgoing HTTP
+call (BoardGameGeek XML API requests and image downloads). Reusing one session
+keeps TCP/TLS connections to boardgamegeek.com alive between calls instead of
+opening a new connection for each request.
+
+Features:
+    - One process-wide session with HTTP keep-alive
+    - Default request headers built once on the session
+    - Connection pool sized for the background worker threads
+    - Transparent retries with exponential backoff for transient failures
+    - Shared (connect, read) timeout so a stalled server cannot hang a worker
+    - Session closed at interpreter exit
+    - Thread-safe for the simple GET requests made by the models
+
+Usage:
+    from utils.http_session import http_session
+
+    response = http_session.get(url, timeout=REQUEST_TIMEOUT)
+"""
+
+import atexit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Number of keep-alive connections kept per host; covers the UI thread plus
+# the background search/detail threads hitting BGG at the same time
+POOL_MAXSIZE = 10
+
+# Retry transient failures (connection errors, BGG throttling with 429, 5xx)
+# inside one logical call instead of surfacing them as empty results.
+# Backoff sleeps 0.2 s, 0.4 s, ... between attempts and honours Retry-After.
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    raise_on_status=False,
+)
+
+# (connect, read) timeout in seconds; the connect timeout is just above the
+# 3 s TCP retransmission window
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Sent with every request; set once on the session instead of per call
+DEFAULT_HEADERS = {
+    "User-Agent": "bgg-flashcards (python-requests)",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+
+def _create_session():
+    """Create the shared session with a pooled, retrying adapter for HTTP and HTTPS.
+
+    Returns:
+        requests.Session: A session ready for concurrent GET requests
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY_POLICY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Global session instance shared by the models and services
+http_session = _create_session()
+
+# Close pooled keep-alive sockets cleanly when the app exits
+atexit.register(http_session.close)
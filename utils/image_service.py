@@ -23,8 +23,8 @@ import base64
 import io
 import requests
 from PIL import Image
-from typing import Optional, Tuple
 from database import Database
+from utils.http_session import REQUEST_TIMEOUT, http_session
 
 
 class ImageService:
@@ -87,18 +87,19 @@ class ImageService:
             return False
             
         try:
-            # Download image
-            response = requests.get(image_url, timeout=30, stream=True)
-            response.raise_for_status()
-            
-            # Check content type
-            content_type = response.headers.get('content-type', '')
-            if not content_type.startswith('image/'):
-                print(f"Invalid content type: {content_type}")
-                return False
-            
-            # Read image data
-            image_data = response.content
+            # Download image; the with block releases the connection back to
+            # the pool even when the body is never read (rejected content type)
+            with http_session.get(image_url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                
+                # Check content type
+                content_type = response.headers.get('content-type', '')
+                if not content_type.startswith('image/'):
+                    print(f"Invalid content type: {content_type}")
+                    return False
+                
+                # Read image data
+                image_data = response.content
             
             # Note: We'll compress large images rather than reject them
             if len(image_data) > ImageService.MAX_IMAGE_SIZE:
@@ -127,7 +128,7 @@ class ImageService:
             return False
     
     @staticmethod
-    def _process_image(image_data: bytes) -> Tuple[Optional[bytes], Optional[str]]:
+    def _process_image(image_data: bytes) -> tuple[bytes | None, str | None]:
         """
         Process and potentially compress an image.
         
@@ -176,7 +177,7 @@ class ImageService:
             return None, None
     
     @staticmethod
-    def _aggressive_compress(image_data: bytes) -> Tuple[Optional[bytes], Optional[str]]:
+    def _aggressive_compress(image_data: bytes) -> tuple[bytes | None, str | None]:
         """
         Apply aggressive compression for oversized images.
         
@@ -300,7 +301,7 @@ class ImageService:
             return False
     
     @staticmethod
-    def get_image_as_base64(game_id: int) -> Optional[str]:
+    def get_image_as_base64(game_id: int) -> str | None:
         """
         Get image data as base64 string for display in Flet.
         
@@ -310,6 +311,44 @@ class ImageService:
         Returns:
             Base64 encoded image data with data URI prefix, or None if not found
         """
+        image = ImageService._read_image(game_id)
+        if image is None:
+            return None
+        
+        image_data, mime_type = image
+        base64_data = base64.b64encode(image_data).decode('ascii')
+        return f"data:{mime_type};base64,{base64_data}"
+    
+    @staticmethod
+    def get_image_base64_raw(game_id: int) -> str | None:
+        """
+        Get image data as a plain base64 string (no data URI prefix).
+        
+        This is the form Flet's Image.src_base64 expects, so callers do not
+        have to split the prefix off a copy of the whole payload.
+        
+        Args:
+            game_id: ID of the game
+            
+        Returns:
+            Base64 encoded image data, or None if not found
+        """
+        image = ImageService._read_image(game_id)
+        if image is None:
+            return None
+        return base64.b64encode(image[0]).decode('ascii')
+    
+    @staticmethod
+    def _read_image(game_id: int) -> tuple[bytes, str] | None:
+        """
+        Read a game's stored image from its PostgreSQL Large Object.
+        
+        Args:
+            game_id: ID of the game
+            
+        Returns:
+            Tuple of (image_data, mime_type), or None if not found or on error
+        """
         try:
             conn = Database.get_connection()
             cursor = conn.cursor()
@@ -349,8 +388,7 @@ class ImageService:
             Database.return_connection(conn)
             
             if image_data:
-                base64_data = base64.b64encode(image_data).decode('utf-8')
-                return f"data:{mime_type};base64,{base64_data}"
+                return image_data, mime_type
             
             return None
             
@@ -0,0 +1,123 @@
+"""TTL Cache Module.
+
+This module provides the TTLCache class, a small thread-safe in-process cache
+with per-entry expiry and a bounded size. It is used by the models to keep
+recently read database rows in memory so repeated lookups (for example on
+every page navigation) skip the PostgreSQL round-trip.
+
+Features:
+    - Per-entry time-to-live with lazy expiry on read
+    - Least-recently-used eviction once maxsize is reached
+    - Thread-safe access for background task threads
+    - Explicit invalidation of single keys or the whole cache
+
+Usage:
+    _user_cache = TTLCache(maxsize=1024, ttl=30)
+
+    row = _user_cache.get(user_id)
+    if row is None:
+        row = load_row_from_db(user_id)
+        _user_cache.set(user_id, row)
+
+    # After a write
+    _user_cache.pop(user_id)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after a fixed time-to-live.
+
+    Entries are stored in an OrderedDict in least-recently-used order so the
+    oldest entry can be evicted in O(1) when the cache is full. Expired entries
+    are dropped lazily when they are read.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept in memory
+        ttl (float): Default time-to-live of an entry, in seconds
+
+    Thread Safety:
+        All operations are guarded by a single lock, so one instance can be
+        shared between the UI thread and background worker threads.
+
+    Note:
+        Cache immutable values (such as database row tuples) rather than
+        model objects, so callers never share mutable state through the cache.
+    """
+    def __init__(self, maxsize=1024, ttl=60):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries. Defaults to 1024.
+            ttl (float, optional): Default time-to-live in seconds. Defaults to 60.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Get a cached value if it exists and has not expired.
+
+        Args:
+            key: The cache key
+            default: Value returned on a miss. Defaults to None.
+
+        Returns:
+            The cached value, or default if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        """Store a value in the cache.
+
+        Args:
+            key: The cache key
+            value: The value to store
+            ttl (float, optional): Time-to-live for this entry in seconds.
+                Defaults to the cache-wide ttl.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Remove a key from the cache.
+
+        Args:
+            key: The cache key to invalidate
+            default: Value returned if the key is not cached. Defaults to None.
+
+        Returns:
+            The removed value (even if expired), or default
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        """Return the number of stored entries (including not yet purged expired ones)."""
+        with self._lock:
+            return len(self._entries)